@@ -7,16 +7,28 @@ __copyright__ = "Copyright 20XX, RocketPy Team"
 __license__ = "MIT"
 
 import bisect
+import copy
+import functools
+import inspect
 import json
+import math
+import os
 import re
 import warnings
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import matplotlib.pyplot as plt
 import numpy as np
 import numpy.ma as ma
 import pytz
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from functools import cached_property
+except ImportError:
+    from .tools import cached_property
 
 try:
     import netCDF4
@@ -29,8 +41,16 @@ except ImportError:
 else:
     has_netCDF4 = True
 
+try:
+    import orjson
+except ImportError:
+    _loads = json.loads
+else:
+    _loads = orjson.loads
+
 
 def requires_netCDF4(func):
+    @functools.wraps(func)
     def wrapped_func(*args, **kwargs):
         if has_netCDF4:
             func(*args, **kwargs)
@@ -42,6 +62,364 @@ def requires_netCDF4(func):
     return wrapped_func
 
 
+# Results of the last forecast and ensemble files processed, so that repeated
+# calls with the same file, dictionary, date and location skip the netCDF and
+# OPeNDAP reads
+_WEATHER_DATASET_CACHE = {}
+_WEATHER_DATASET_CACHE_SIZE = 8
+
+
+def _cache_weather_dataset(*attributes):
+    """Decorator for processing methods that read netCDF datasets. The given
+    attributes set by the method are stored after a successful call and
+    restored on later calls with the same arguments, Environment date,
+    location, gravity and datum. Local files are only reused while their
+    modification time is unchanged."""
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapped_func(self, *args, **kwargs):
+            arguments = signature.bind(self, *args, **kwargs).arguments
+            file, dictionary = arguments["file"], arguments["dictionary"]
+            if str(file).startswith(("http://", "https://")):
+                version = None
+            else:
+                try:
+                    version = os.stat(file).st_mtime_ns
+                except (OSError, TypeError):
+                    return func(self, *args, **kwargs)
+            names = attributes
+            if dictionary.get("surface_geopotential_height") is not None:
+                names += ("elevation",)
+            key = (
+                func.__name__,
+                file,
+                version,
+                tuple(sorted(dictionary.items())),
+                self.date,
+                self.lat,
+                self.lon,
+                self.g,
+                self.datum,
+            )
+            if key not in _WEATHER_DATASET_CACHE:
+                func(self, *args, **kwargs)
+                if len(_WEATHER_DATASET_CACHE) >= _WEATHER_DATASET_CACHE_SIZE:
+                    _WEATHER_DATASET_CACHE.pop(next(iter(_WEATHER_DATASET_CACHE)))
+                _WEATHER_DATASET_CACHE[key] = copy.deepcopy(
+                    {name: self.__dict__[name] for name in names}
+                )
+                return None
+            # Values are copied both ways so that changes made to one
+            # Environment, including its arrays and lists, are not seen by
+            # the others
+            self.__dict__.update(copy.deepcopy(_WEATHER_DATASET_CACHE[key]))
+            return None
+
+        return wrapped_func
+
+    return decorator
+
+
+# Time zone objects are immutable, so lookups can be shared between instances
+_UTC = pytz.UTC
+
+
+@lru_cache(maxsize=32)
+def _get_tz(name):
+    return pytz.timezone(name)
+
+
+# Keep-alive session reused by every elevation and weather data request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+@lru_cache(maxsize=256)
+def _fetch_open_elevation(lat, lon):
+    requestURL = (
+        "https://api.open-elevation.com/api/v1/lookup?locations={:f},{:f}".format(
+            lat, lon
+        )
+    )
+    response = _SESSION.get(requestURL, timeout=10)
+    results = _loads(response.content)["results"]
+    return results[0]["elevation"]
+
+
+# Regular expressions used to parse sounding pages
+_NO_OBSERVATIONS_RE = re.compile("Can't get .+ Observations at .+")
+_PRE_TAG_RE = re.compile("(<.{0,1}PRE>)")
+_NUMBER_RE = re.compile(r"[0-9]+\.[0-9]+|[0-9]+")
+
+# Errors raised by netCDF4 when a variable is missing from a weather file, the
+# requested slice is out of its bounds or the data cannot be read
+_NETCDF_READ_ERRORS = (KeyError, IndexError, OSError, RuntimeError)
+
+
+# Attributes defined by Environment.setAtmosphericModel("StandardAtmosphere")
+_STANDARD_ATMOSPHERE_ATTRIBUTES = frozenset(
+    [
+        "pressure",
+        "temperature",
+        "windDirection",
+        "windHeading",
+        "windSpeed",
+        "windVelocityX",
+        "windVelocityY",
+        "maxExpectedHeight",
+        "density",
+        "speedOfSound",
+        "dynamicViscosity",
+    ]
+)
+
+
+# Default dictionaries used to read forecast, reanalysis and ensemble files
+_NOAA_DICT = {
+    "time": "time",
+    "latitude": "lat",
+    "longitude": "lon",
+    "level": "lev",
+    "temperature": "tmpprs",
+    "surface_geopotential_height": "hgtsfc",
+    "geopotential_height": "hgtprs",
+    "geopotential": None,
+    "u_wind": "ugrdprs",
+    "v_wind": "vgrdprs",
+}
+_ECMWF_DICT = {
+    "time": "time",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "level": "level",
+    "temperature": "t",
+    "surface_geopotential_height": None,
+    "geopotential_height": None,
+    "geopotential": "z",
+    "u_wind": "u",
+    "v_wind": "v",
+}
+_NOAA_ENSEMBLE_DICT = {
+    "time": "time",
+    "latitude": "lat",
+    "longitude": "lon",
+    "level": "lev",
+    "ensemble": "ens",
+    "temperature": "tmpprs",
+    "surface_geopotential_height": None,
+    "geopotential_height": "hgtprs",
+    "geopotential": None,
+    "u_wind": "ugrdprs",
+    "v_wind": "vgrdprs",
+}
+_ECMWF_ENSEMBLE_DICT = {
+    "time": "time",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "level": "level",
+    "ensemble": "number",
+    "temperature": "t",
+    "surface_geopotential_height": None,
+    "geopotential_height": None,
+    "geopotential": "z",
+    "u_wind": "u",
+    "v_wind": "v",
+}
+
+
+# Default forecasts: url template, dictionary and cycle length in hours
+_FORECAST_PRESETS = {
+    "GFS": (
+        "https://nomads.ncep.noaa.gov/dods/gfs_0p25/gfs{:04d}{:02d}{:02d}/gfs_0p25_{:02d}z".format,
+        _NOAA_DICT,
+        6,
+    ),
+    "FV3": (
+        "https://nomads.ncep.noaa.gov/dods/gfs_0p25_parafv3/gfs{:04d}{:02d}{:02d}/gfs_0p25_parafv3_{:02d}z".format,
+        _NOAA_DICT,
+        6,
+    ),
+    "NAM": (
+        "https://nomads.ncep.noaa.gov/dods/nam/nam{:04d}{:02d}{:02d}/nam_conusnest_{:02d}z".format,
+        _NOAA_DICT,
+        6,
+    ),
+    "RAP": (
+        "https://nomads.ncep.noaa.gov/dods/rap/rap{:04d}{:02d}{:02d}/rap_{:02d}z".format,
+        _NOAA_DICT,
+        1,
+    ),
+}
+_ENSEMBLE_PRESETS = {
+    "GEFS": (
+        "https://nomads.ncep.noaa.gov/dods/gens_bc/gens{:04d}{:02d}{:02d}/gep_all_{:02d}z".format,
+        _NOAA_ENSEMBLE_DICT,
+        6,
+    ),
+    "CMC": (
+        "https://nomads.ncep.noaa.gov/dods/cmcens/cmcens{:04d}{:02d}{:02d}/cmcens_all_{:02d}z".format,
+        _NOAA_ENSEMBLE_DICT,
+        12,
+    ),
+}
+_DEFAULT_DICTIONARIES = {"ECMWF": _ECMWF_DICT, "NOAA": _NOAA_DICT}
+_DEFAULT_ENSEMBLE_DICTIONARIES = {
+    "ECMWF": _ECMWF_ENSEMBLE_DICT,
+    "NOAA": _NOAA_ENSEMBLE_DICT,
+}
+
+
+# Reference ellipsoids (semi-major axis in meters, flattening) by datum
+_ELLIPSOIDS = {
+    "SAD69": (6378160.0, 1 / 298.25),
+    "WGS84": (6378137.0, 1 / 298.257223563),
+    "NAD83": (6378137.0, 1 / 298.257024899),
+    "SIRGAS2000": (6378137.0, 1 / 298.257223563),
+}
+
+
+def _bilinear_weights(x, x1, x2, y, y1, y2):
+    """Weights of the corners of the grid cell (x1, x2) x (y1, y2) when
+    interpolating at (x, y). They only depend on the point and the cell, so
+    they are computed once and shared by every interpolated variable."""
+    dx, dy = x2 - x1, y2 - y1
+    return (x2 - x) / dx, (x - x1) / dx, (y2 - y) / dy, (y - y1) / dy
+
+
+def _bilinear_interpolation(values, weights):
+    """Bilinear interpolation of values given at the corners of a grid cell,
+    using the weights returned by _bilinear_weights. The last two axes of
+    values correspond to (x1, x2) and (y1, y2), any leading axes, such as
+    pressure levels or ensemble members, are interpolated at once."""
+    wx1, wx2, wy1, wy2 = weights
+    f_x_y1 = wx1 * values[..., 0, 0] + wx2 * values[..., 1, 0]
+    f_x_y2 = wx1 * values[..., 0, 1] + wx2 * values[..., 1, 1]
+    return wy1 * f_x_y1 + wy2 * f_x_y2
+
+
+# International standard atmosphere layers, shared by every standard atmosphere
+_ISA_GEOPOTENTIAL_HEIGHT = np.array(
+    [
+        -2e3,
+        0,
+        11e3,
+        20e3,
+        32e3,
+        47e3,
+        51e3,
+        71e3,
+        80e3,
+    ]
+)  # in geopotential m
+_ISA_TEMPERATURE = np.array(
+    [
+        301.15,
+        288.15,
+        216.65,
+        216.65,
+        228.65,
+        270.65,
+        270.65,
+        214.65,
+        196.65,
+    ]
+)  # in K
+_ISA_BETA = np.array(
+    [
+        -6.5e-3,
+        -6.5e-3,
+        0,
+        1e-3,
+        2.8e-3,
+        0,
+        -2.8e-3,
+        -2e-3,
+        0,
+    ]
+)  # Temperature gradient in K/m
+_ISA_PRESSURE = np.array(
+    [
+        1.27774e5,
+        1.01325e5,
+        2.26320e4,
+        5.47487e3,
+        8.680164e2,
+        1.10906e2,
+        6.69384e1,
+        3.95639e0,
+        8.86272e-2,
+    ]
+)  # in Pa
+
+
+# The standard atmosphere only depends on gravity and the air gas constant, so
+# it is built once and copied to each Environment that needs it
+@lru_cache(maxsize=8)
+def _international_standard_atmosphere(g, R):
+    # Retrieve international standard atmosphere layers
+    geopotential_height = _ISA_GEOPOTENTIAL_HEIGHT
+    temperature = _ISA_TEMPERATURE
+    beta = _ISA_BETA
+    pressure = _ISA_PRESSURE
+
+    # Geometric height is taken as equal to geopotential height
+    height = geopotential_height
+
+    # Save international standard atmosphere temperature profile
+    temperatureISA = Function(
+        np.column_stack([height, temperature]),
+        inputs="Height Above Sea Level (m)",
+        outputs="Temperature (K)",
+        interpolation="linear",
+    )
+
+    # Pressure exponent of each layer, only used where beta is not zero
+    with np.errstate(divide="ignore"):
+        exponent = -g / (beta * R)
+
+    # Create function to compute pressure profile, which accepts either a
+    # single height or an array of heights
+    def pressure_function(h):
+        # Geopotential height is taken as equal to geometric height, and
+        # heights outside the layers get the pressure of the closest boundary
+        H = np.clip(h, geopotential_height[0], geopotential_height[-1])
+
+        # Find layer that contains height h
+        layer = np.searchsorted(geopotential_height, H, side="right") - 1
+
+        # Retrieve layer base geopotential height, temp, beta and pressure
+        Hb = geopotential_height[layer]
+        Tb = temperature[layer]
+        Pb = pressure[layer]
+        B = beta[layer]
+
+        # Compute presure, using the isothermal solution where beta is zero
+        P = np.where(
+            B != 0,
+            Pb * (1 + (B / Tb) * (H - Hb)) ** exponent[layer],
+            Pb * np.exp(-(H - Hb) * (g / (R * Tb))),
+        )
+
+        # Return answer
+        return P[()]
+
+    # Save international standard atmosphere pressure profile, tabulated every
+    # 10 m so that it is evaluated by interpolation instead of layer searches
+    heights = np.arange(geopotential_height[0], geopotential_height[-1] + 1, 10.0)
+    pressureISA = Function(
+        np.column_stack([heights, pressure_function(heights)]),
+        inputs="Height Above Sea Level (m)",
+        outputs="Pressure (Pa)",
+        interpolation="linear",
+    )
+
+    return temperatureISA, pressureISA
+
+
 class Environment:
     """Keeps all environment information stored, such as wind and temperature
     conditions, as well as gravity and rail length.
@@ -368,18 +746,18 @@ class Environment:
             self.timeZone = None
 
         # Initialize constants
-        self.earthRadius = 6.3781 * (10**6)
         self.airGasConstant = 287.05287  # in J/K/Kg
 
-        # Initialize atmosphere
-        self.setAtmosphericModel("StandardAtmosphere")
-
         # Save latitude and longitude
         if latitude != None and longitude != None:
             self.setLocation(latitude, longitude)
         else:
             self.lat, self.lon = None, None
 
+        # Initialize atmosphere, the standard atmosphere profiles are only
+        # built when first accessed since they are often replaced right away
+        self.atmosphericModelType = "StandardAtmosphere"
+
         # Store launch site coordinates referenced to UTM projection system
         if self.lat > -80 and self.lat < 84:
             convert = self.geodesicToUtm(self.lat, self.lon, self.datum)
@@ -393,19 +771,65 @@ class Environment:
         # Save elevation
         self.setElevation(elevation)
 
-        # Recalculate Earth Radius
-        self.earthRadius = self.calculateEarthRadius(self.lat, self.datum)  # in m
-
         return None
 
+    def __getattr__(self, name):
+        """Builds the default standard atmosphere the first time one of its
+        profiles is accessed. Only called when normal attribute lookup fails,
+        which includes properties raising AttributeError, so any other name
+        is reported as missing right away."""
+        if name in ("pressureISA", "temperatureISA") and name not in self.__dict__:
+            self.loadInternationalStandardAtmosphere()
+            return object.__getattribute__(self, name)
+        # Profiles set by calling a process method directly are never
+        # replaced, the standard atmosphere is only built if none exists
+        if (
+            name in _STANDARD_ATMOSPHERE_ATTRIBUTES
+            and self.__dict__.get("atmosphericModelType") == "StandardAtmosphere"
+            and self.__dict__.keys().isdisjoint(_STANDARD_ATMOSPHERE_ATTRIBUTES)
+        ):
+            self.setAtmosphericModel("StandardAtmosphere")
+            return object.__getattribute__(self, name)
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+        )
+
+    @cached_property
+    def earthRadius(self):
+        """Earth radius at the launch site latitude, in meters, according to
+        the reference ellipsoid given by Environment.datum."""
+        return self.calculateEarthRadius(self.lat, self.datum)
+
+    # Ensemble wind speed, heading and direction are derived from the stored
+    # wind components whenever they are needed instead of being kept in memory
+    @property
+    def windSpeedEnsemble(self):
+        """Wind speed of every ensemble member, in m/s. Only defined when
+        using Ensembles."""
+        return np.hypot(self.windUEnsemble, self.windVEnsemble)
+
+    @property
+    def windHeadingEnsemble(self):
+        """Wind heading of every ensemble member, in degrees. Only defined when
+        using Ensembles."""
+        return np.rad2deg(np.arctan2(self.windUEnsemble, self.windVEnsemble)) % 360
+
+    @property
+    def windDirectionEnsemble(self):
+        """Wind direction of every ensemble member, in degrees. Only defined
+        when using Ensembles."""
+        return (self.windHeadingEnsemble + 180) % 360
+
     def setDate(self, date, timeZone="UTC"):
         """Set date and time of launch and update weather conditions if
         date dependent atmospheric model is used.
 
         Parameters
         ----------
-        date : Datetime
-            Datetime object specifying launch date and time.
+        date : Datetime, numpy.datetime64 or tuple
+            Datetime object specifying launch date and time. A
+            numpy.datetime64 or a tuple such as (year, month, day, hour)
+            are also accepted.
         timeZone : string, optional
             Name of the time zone. To see all time zones, import pytz and run
         print(pytz.all_timezones). Default time zone is "UTC".
@@ -416,15 +840,18 @@ class Environment:
         """
         # Store date and configure time zone
         self.timeZone = timeZone
-        tz = pytz.timezone(self.timeZone)
-        if type(date) != datetime:
-            localDate = datetime(*date)
-        else:
+        tz = _get_tz(self.timeZone)
+        if isinstance(date, datetime):
             localDate = date
+        elif isinstance(date, np.datetime64):
+            # Microsecond precision converts to datetime instead of int
+            localDate = date.astype("datetime64[us]").astype(datetime)
+        else:
+            localDate = datetime(*date)
         if localDate.tzinfo == None:
             localDate = tz.localize(localDate)
         self.localDate = localDate
-        self.date = self.localDate.astimezone(pytz.UTC)
+        self.date = self.localDate.astimezone(_UTC)
 
         # Update atmospheric conditions if atmosphere type is Forecast,
         # Reanalysis or Ensemble
@@ -459,9 +886,16 @@ class Environment:
         self.lat = latitude
         self.lon = longitude
 
+        # Earth radius depends on latitude and must be recalculated
+        self.__dict__.pop("earthRadius", None)
+
         # Update atmospheric conditions if atmosphere type is Forecast,
         # Reanalysis or Ensemble
-        if self.atmosphericModelType in ["Forecast", "Reanalysis", "Ensemble"]:
+        if getattr(self, "atmosphericModelType", None) in [
+            "Forecast",
+            "Reanalysis",
+            "Ensemble",
+        ]:
             self.setAtmosphericModel(
                 self.atmosphericModelFile, self.atmosphericModelDict
             )
@@ -504,12 +938,9 @@ class Environment:
         elif self.lat != None and self.lon != None:
             try:
                 print("Fetching elevation from open-elevation.com...")
-                requestURL = "https://api.open-elevation.com/api/v1/lookup?locations={:f},{:f}".format(
-                    self.lat, self.lon
+                self.elevation = _fetch_open_elevation(
+                    round(self.lat, 5), round(self.lon, 5)
                 )
-                response = requests.get(requestURL)
-                results = response.json()["results"]
-                self.elevation = results[0]["elevation"]
                 print("Elevation received:", self.elevation)
             except:
                 raise RuntimeError("Unabel to reach Open-Elevation API servers.")
@@ -549,16 +980,36 @@ class Environment:
         if type == "NASADEM_HGT":
             if dictionary == "netCDF4":
                 rootgrp = netCDF4.Dataset(file, "r", format="NETCDF4")
-                self.elevLonArray = rootgrp.variables["lon"][:].tolist()
-                self.elevLatArray = rootgrp.variables["lat"][:].tolist()
-                self.elevArray = rootgrp.variables["NASADEM_HGT"][:].tolist()
+                # Keep coordinates and elevations as contiguous arrays, reading
+                # every variable as a plain array instead of a masked one
+                rootgrp.set_auto_maskandscale(False)
+                elevLonArray = rootgrp.variables["lon"][:]
+                elevLatArray = rootgrp.variables["lat"][:]
+                elevArray = rootgrp.variables["NASADEM_HGT"][:]
                 # crsArray = rootgrp.variables['crs'][:].tolist().
+                # Store both axes in ascending order so lookups can search
+                # them directly, flipping the elevation grid to match
+                if elevLatArray[0] > elevLatArray[-1]:
+                    elevLatArray = elevLatArray[::-1]
+                    elevArray = elevArray[::-1, :]
+                if elevLonArray[0] > elevLonArray[-1]:
+                    elevLonArray = elevLonArray[::-1]
+                    elevArray = elevArray[:, ::-1]
+                self.elevLonArray = np.ascontiguousarray(elevLonArray, dtype=np.float64)
+                self.elevLatArray = np.ascontiguousarray(elevLatArray, dtype=np.float64)
+                self.elevArray = np.ascontiguousarray(elevArray, dtype=np.float32)
+                # Plain lists make single point lookups cheaper than numpy
+                self._elevLatList = self.elevLatArray.tolist()
+                self._elevLonList = self.elevLonArray.tolist()
+                # Determine if file uses -180 to 180 or 0 to 360
+                self._lonIsSigned = bool(self.elevLonArray[0] < 0)
+                rootgrp.close()
                 self.topographicProfileActivated = True
 
                 print("Region covered by the Topographical file: ")
                 print(
                     "Latitude from {:.6f}° to {:.6f}°".format(
-                        self.elevLatArray[-1], self.elevLatArray[0]
+                        self.elevLatArray[0], self.elevLatArray[-1]
                     )
                 )
                 print(
@@ -571,7 +1022,8 @@ class Environment:
 
     def getElevationFromTopographicProfile(self, lat, lon):
         """Function which receives as inputs the coordinates of a point and finds its
-        elevation in the provided Topographic Profile
+        elevation in the provided Topographic Profile by bilinear interpolation
+        of the four surrounding grid points.
 
         Parameters
         ----------
@@ -588,9 +1040,9 @@ class Environment:
         Raises
         ------
         ValueError
-            [description]
+            If the latitude is not inside the region covered by the file.
         ValueError
-            [description]
+            If the longitude is not inside the region covered by the file.
         """
         if self.topographicProfileActivated == False:
             print(
@@ -598,69 +1050,110 @@ class Environment:
             )
             return None
 
-        # Find latitude index
-        # Check if reversed or sorted
-        if self.elevLatArray[0] < self.elevLatArray[-1]:
-            # Deal with sorted self.elevLatArray
-            latIndex = bisect.bisect(self.elevLatArray, lat)
-        else:
-            # Deal with reversed self.elevLatArray
-            self.elevLatArray.reverse()
-            latIndex = len(self.elevLatArray) - bisect.bisect_left(
-                self.elevLatArray, lat
-            )
-            self.elevLatArray.reverse()
-        # Take care of latitude value equal to maximum longitude in the grid
-        if (
-            latIndex == len(self.elevLatArray)
-            and self.elevLatArray[latIndex - 1] == lat
-        ):
-            latIndex = latIndex - 1
+        latList, lonList = self._elevLatList, self._elevLonList
+
         # Check if latitude value is inside the grid
-        if latIndex == 0 or latIndex == len(self.elevLatArray):
+        if not latList[0] <= lat <= latList[-1]:
             raise ValueError(
                 "Latitude {:f} not inside region covered by file, which is from {:f} to {:f}.".format(
-                    lat, self.elevLatArray[0], self.elevLatArray[-1]
+                    lat, latList[0], latList[-1]
                 )
             )
 
-        # Find longitude index
-        # Determine if file uses -180 to 180 or 0 to 360
-        if self.elevLonArray[0] < 0 or self.elevLonArray[-1] < 0:
-            # Convert input to -180 - 180
-            lon = lon if lon < 180 else -180 + lon % 180
+        # Check if longitude value is inside the grid
+        if self._lonIsSigned:
+            # Convert input to -180 - 180, so that 360 maps to 0 and 180 to -180
+            lon = (lon + 180) % 360 - 180
         else:
             # Convert input to 0 - 360
             lon = lon % 360
-        # Check if reversed or sorted
-        if self.elevLonArray[0] < self.elevLonArray[-1]:
-            # Deal with sorted self.elevLonArray
-            lonIndex = bisect.bisect(self.elevLonArray, lon)
-        else:
-            # Deal with reversed self.elevLonArray
-            self.elevLonArray.reverse()
-            lonIndex = len(self.elevLonArray) - bisect.bisect_left(
-                self.elevLonArray, lon
-            )
-            self.elevLonArray.reverse()
-        # Take care of longitude value equal to maximum longitude in the grid
-        if (
-            lonIndex == len(self.elevLonArray)
-            and self.elevLonArray[lonIndex - 1] == lon
-        ):
-            lonIndex = lonIndex - 1
-        # Check if longitude value is inside the grid
-        if lonIndex == 0 or lonIndex == len(self.elevLonArray):
+        if not lonList[0] <= lon <= lonList[-1]:
             raise ValueError(
                 "Longitude {:f} not inside region covered by file, which is from {:f} to {:f}.".format(
-                    lon, self.elevLonArray[0], self.elevLonArray[-1]
+                    lon, lonList[0], lonList[-1]
                 )
             )
 
-        # Get the elevation
-        elevation = self.elevArray[latIndex][lonIndex]
+        # Find lower corner of the cell, same as in getElevationBatch but
+        # without the overhead of numpy calls on single values
+        i = min(bisect.bisect_right(latList, lat), len(latList) - 1) - 1
+        j = min(bisect.bisect_right(lonList, lon), len(lonList) - 1) - 1
+        u = (lat - latList[i]) / (latList[i + 1] - latList[i])
+        v = (lon - lonList[j]) / (lonList[j + 1] - lonList[j])
+
+        # Interpolate between the four corners
+        elev = self.elevArray
+        elevation = (
+            (1 - u) * (1 - v) * elev.item(i, j)
+            + u * (1 - v) * elev.item(i + 1, j)
+            + (1 - u) * v * elev.item(i, j + 1)
+            + u * v * elev.item(i + 1, j + 1)
+        )
+
+        return float(elevation)
+
+    def getElevationBatch(self, lats, lons):
+        """Computes the elevation of several points at once by bilinear
+        interpolation of the provided Topographic Profile. Points outside the
+        region covered by the file do not raise errors, their elevation is
+        returned as NaN instead.
 
-        return elevation
+        Parameters
+        ----------
+        lats : array_like
+            Latitudes of the points.
+        lons : array_like
+            Longitudes of the points, same length as lats.
+
+        Returns
+        -------
+        elevations : numpy.ndarray
+            Elevations provided by the topographic data, in meters. NaN for
+            points outside the region covered by the file.
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = self.__wrapTopographicLongitude(np.asarray(lons, dtype=np.float64))
+
+        # Flag points inside the grid, the others are clamped and masked later
+        valid = (
+            (lats >= self.elevLatArray[0])
+            & (lats <= self.elevLatArray[-1])
+            & (lons >= self.elevLonArray[0])
+            & (lons <= self.elevLonArray[-1])
+        )
+
+        # Find lower corner of the cell containing each point
+        i = np.searchsorted(self.elevLatArray, lats, side="right") - 1
+        i = np.clip(i, 0, len(self.elevLatArray) - 2)
+        j = np.searchsorted(self.elevLonArray, lons, side="right") - 1
+        j = np.clip(j, 0, len(self.elevLonArray) - 2)
+
+        # Compute position of each point inside its cell
+        lat0, lat1 = self.elevLatArray[i], self.elevLatArray[i + 1]
+        lon0, lon1 = self.elevLonArray[j], self.elevLonArray[j + 1]
+        u = np.clip((lats - lat0) / (lat1 - lat0), 0, 1)
+        v = np.clip((lons - lon0) / (lon1 - lon0), 0, 1)
+
+        # Interpolate between the four corners
+        elev = self.elevArray
+        elevations = (
+            (1 - u) * (1 - v) * elev[i, j]
+            + u * (1 - v) * elev[i + 1, j]
+            + (1 - u) * v * elev[i, j + 1]
+            + u * v * elev[i + 1, j + 1]
+        )
+
+        return np.where(valid, elevations, np.nan)
+
+    def __wrapTopographicLongitude(self, lon):
+        """Converts longitudes to the convention used by the topographic file,
+        either -180 to 180 or 0 to 360."""
+        if self._lonIsSigned:
+            # Convert input to -180 - 180, so that 360 maps to 0 and 180 to -180
+            return (lon + 180) % 360 - 180
+        else:
+            # Convert input to 0 - 360
+            return lon % 360
 
     def setAtmosphericModel(
         self,
@@ -911,179 +1404,19 @@ class Environment:
             self.atmosphericModelFile = file
         elif type == "Forecast" or type == "Reanalysis":
             # Process default forecasts if requested
-            if file == "GFS":
-                # Define dictionary
-                dictionary = {
-                    "time": "time",
-                    "latitude": "lat",
-                    "longitude": "lon",
-                    "level": "lev",
-                    "temperature": "tmpprs",
-                    "surface_geopotential_height": "hgtsfc",
-                    "geopotential_height": "hgtprs",
-                    "geopotential": None,
-                    "u_wind": "ugrdprs",
-                    "v_wind": "vgrdprs",
-                }
-                # Attempt to get latest forecast
-                timeAttempt = datetime.utcnow()
-                success = False
-                attemptCount = 0
-                while not success and attemptCount < 10:
-                    timeAttempt -= timedelta(hours=6 * attemptCount)
-                    file = "https://nomads.ncep.noaa.gov/dods/gfs_0p25/gfs{:04d}{:02d}{:02d}/gfs_0p25_{:02d}z".format(
-                        timeAttempt.year,
-                        timeAttempt.month,
-                        timeAttempt.day,
-                        6 * (timeAttempt.hour // 6),
-                    )
-                    try:
-                        self.processForecastReanalysis(file, dictionary)
-                        success = True
-                    except OSError:
-                        attemptCount += 1
-                if not success:
-                    raise RuntimeError(
-                        "Unable to load latest weather data for GFS through " + file
-                    )
-            elif file == "FV3":
-                # Define dictionary
-                dictionary = {
-                    "time": "time",
-                    "latitude": "lat",
-                    "longitude": "lon",
-                    "level": "lev",
-                    "temperature": "tmpprs",
-                    "surface_geopotential_height": "hgtsfc",
-                    "geopotential_height": "hgtprs",
-                    "geopotential": None,
-                    "u_wind": "ugrdprs",
-                    "v_wind": "vgrdprs",
-                }
-                # Attempt to get latest forecast
-                timeAttempt = datetime.utcnow()
-                success = False
-                attemptCount = 0
-                while not success and attemptCount < 10:
-                    timeAttempt -= timedelta(hours=6 * attemptCount)
-                    file = "https://nomads.ncep.noaa.gov/dods/gfs_0p25_parafv3/gfs{:04d}{:02d}{:02d}/gfs_0p25_parafv3_{:02d}z".format(
-                        timeAttempt.year,
-                        timeAttempt.month,
-                        timeAttempt.day,
-                        6 * (timeAttempt.hour // 6),
-                    )
-                    try:
-                        self.processForecastReanalysis(file, dictionary)
-                        success = True
-                    except OSError:
-                        attemptCount += 1
-                if not success:
-                    raise RuntimeError(
-                        "Unable to load latest weather data for FV3 through " + file
-                    )
-            elif file == "NAM":
-                # Define dictionary
-                dictionary = {
-                    "time": "time",
-                    "latitude": "lat",
-                    "longitude": "lon",
-                    "level": "lev",
-                    "temperature": "tmpprs",
-                    "surface_geopotential_height": "hgtsfc",
-                    "geopotential_height": "hgtprs",
-                    "geopotential": None,
-                    "u_wind": "ugrdprs",
-                    "v_wind": "vgrdprs",
-                }
-                # Attempt to get latest forecast
-                timeAttempt = datetime.utcnow()
-                success = False
-                attemptCount = 0
-                while not success and attemptCount < 10:
-                    timeAttempt -= timedelta(hours=6 * attemptCount)
-                    file = "https://nomads.ncep.noaa.gov/dods/nam/nam{:04d}{:02d}{:02d}/nam_conusnest_{:02d}z".format(
-                        timeAttempt.year,
-                        timeAttempt.month,
-                        timeAttempt.day,
-                        6 * (timeAttempt.hour // 6),
-                    )
-                    try:
-                        self.processForecastReanalysis(file, dictionary)
-                        success = True
-                    except OSError:
-                        attemptCount += 1
-                if not success:
-                    raise RuntimeError(
-                        "Unable to load latest weather data for NAM through " + file
-                    )
-            elif file == "RAP":
-                # Define dictionary
-                dictionary = {
-                    "time": "time",
-                    "latitude": "lat",
-                    "longitude": "lon",
-                    "level": "lev",
-                    "temperature": "tmpprs",
-                    "surface_geopotential_height": "hgtsfc",
-                    "geopotential_height": "hgtprs",
-                    "geopotential": None,
-                    "u_wind": "ugrdprs",
-                    "v_wind": "vgrdprs",
-                }
-                # Attempt to get latest forecast
-                timeAttempt = datetime.utcnow()
-                success = False
-                attemptCount = 0
-                while not success and attemptCount < 10:
-                    timeAttempt -= timedelta(hours=1 * attemptCount)
-                    file = "https://nomads.ncep.noaa.gov/dods/rap/rap{:04d}{:02d}{:02d}/rap_{:02d}z".format(
-                        timeAttempt.year,
-                        timeAttempt.month,
-                        timeAttempt.day,
-                        timeAttempt.hour,
-                    )
-                    try:
-                        self.processForecastReanalysis(file, dictionary)
-                        success = True
-                    except OSError:
-                        attemptCount += 1
-                if not success:
-                    raise RuntimeError(
-                        "Unable to load latest weather data for RAP through " + file
-                    )
+            if file in _FORECAST_PRESETS:
+                file, dictionary = self.__processLatestForecast(
+                    file, _FORECAST_PRESETS[file], self.processForecastReanalysis
+                )
             # Process other forecasts or reanalysis
             else:
                 # Check if default dictionary was requested
-                if dictionary == "ECMWF":
-                    dictionary = {
-                        "time": "time",
-                        "latitude": "latitude",
-                        "longitude": "longitude",
-                        "level": "level",
-                        "temperature": "t",
-                        "surface_geopotential_height": None,
-                        "geopotential_height": None,
-                        "geopotential": "z",
-                        "u_wind": "u",
-                        "v_wind": "v",
-                    }
-                elif dictionary == "NOAA":
-                    dictionary = {
-                        "time": "time",
-                        "latitude": "lat",
-                        "longitude": "lon",
-                        "level": "lev",
-                        "temperature": "tmpprs",
-                        "surface_geopotential_height": "hgtsfc",
-                        "geopotential_height": "hgtprs",
-                        "geopotential": None,
-                        "u_wind": "ugrdprs",
-                        "v_wind": "vgrdprs",
-                    }
-                elif dictionary is None:
+                if dictionary is None:
                     raise TypeError(
                         "Please specify a dictionary or choose a default one such as ECMWF or NOAA."
                     )
+                if isinstance(dictionary, str):
+                    dictionary = _DEFAULT_DICTIONARIES.get(dictionary, dictionary)
                 # Process forecast or reanalysis
                 self.processForecastReanalysis(file, dictionary)
             # Save dictionary and file
@@ -1091,109 +1424,17 @@ class Environment:
             self.atmosphericModelDict = dictionary
         elif type == "Ensemble":
             # Process default forecasts if requested
-            if file == "GEFS":
-                # Define dictionary
-                dictionary = {
-                    "time": "time",
-                    "latitude": "lat",
-                    "longitude": "lon",
-                    "level": "lev",
-                    "ensemble": "ens",
-                    "temperature": "tmpprs",
-                    "surface_geopotential_height": None,
-                    "geopotential_height": "hgtprs",
-                    "geopotential": None,
-                    "u_wind": "ugrdprs",
-                    "v_wind": "vgrdprs",
-                }
-                # Attempt to get latest forecast
-                timeAttempt = datetime.utcnow()
-                success = False
-                attemptCount = 0
-                while not success and attemptCount < 10:
-                    timeAttempt -= timedelta(hours=6 * attemptCount)
-                    file = "https://nomads.ncep.noaa.gov/dods/gens_bc/gens{:04d}{:02d}{:02d}/gep_all_{:02d}z".format(
-                        timeAttempt.year,
-                        timeAttempt.month,
-                        timeAttempt.day,
-                        6 * (timeAttempt.hour // 6),
-                    )
-                    try:
-                        self.processEnsemble(file, dictionary)
-                        success = True
-                    except OSError:
-                        attemptCount += 1
-                if not success:
-                    raise RuntimeError(
-                        "Unable to load latest weather data for GEFS through " + file
-                    )
-            elif file == "CMC":
-                # Define dictionary
-                dictionary = {
-                    "time": "time",
-                    "latitude": "lat",
-                    "longitude": "lon",
-                    "level": "lev",
-                    "ensemble": "ens",
-                    "temperature": "tmpprs",
-                    "surface_geopotential_height": None,
-                    "geopotential_height": "hgtprs",
-                    "geopotential": None,
-                    "u_wind": "ugrdprs",
-                    "v_wind": "vgrdprs",
-                }
-                # Attempt to get latest forecast
-                timeAttempt = datetime.utcnow()
-                success = False
-                attemptCount = 0
-                while not success and attemptCount < 10:
-                    timeAttempt -= timedelta(hours=12 * attemptCount)
-                    file = "https://nomads.ncep.noaa.gov/dods/cmcens/cmcens{:04d}{:02d}{:02d}/cmcens_all_{:02d}z".format(
-                        timeAttempt.year,
-                        timeAttempt.month,
-                        timeAttempt.day,
-                        12 * (timeAttempt.hour // 12),
-                    )
-                    try:
-                        self.processEnsemble(file, dictionary)
-                        success = True
-                    except OSError:
-                        attemptCount += 1
-                if not success:
-                    raise RuntimeError(
-                        "Unable to load latest weather data for CMC through " + file
-                    )
+            if file in _ENSEMBLE_PRESETS:
+                file, dictionary = self.__processLatestForecast(
+                    file, _ENSEMBLE_PRESETS[file], self.processEnsemble
+                )
             # Process other forecasts or reanalysis
             else:
                 # Check if default dictionary was requested
-                if dictionary == "ECMWF":
-                    dictionary = {
-                        "time": "time",
-                        "latitude": "latitude",
-                        "longitude": "longitude",
-                        "level": "level",
-                        "ensemble": "number",
-                        "temperature": "t",
-                        "surface_geopotential_height": None,
-                        "geopotential_height": None,
-                        "geopotential": "z",
-                        "u_wind": "u",
-                        "v_wind": "v",
-                    }
-                elif dictionary == "NOAA":
-                    dictionary = {
-                        "time": "time",
-                        "latitude": "lat",
-                        "longitude": "lon",
-                        "level": "lev",
-                        "ensemble": "ens",
-                        "temperature": "tmpprs",
-                        "surface_geopotential_height": None,
-                        "geopotential_height": "hgtprs",
-                        "geopotential": None,
-                        "u_wind": "ugrdprs",
-                        "v_wind": "vgrdprs",
-                    }
+                if isinstance(dictionary, str):
+                    dictionary = _DEFAULT_ENSEMBLE_DICTIONARIES.get(
+                        dictionary, dictionary
+                    )
                 # Process forecast or reanalysis
                 self.processEnsemble(file, dictionary)
             # Save dictionary and file
@@ -1206,16 +1447,55 @@ class Environment:
         else:
             raise ValueError("Unknown model type.")
 
-        # Calculate air density
-        self.calculateDensityProfile()
+        # Calculate air density, speed of sound and dynamic viscosity
+        self.__calculateDerivedProfiles()
 
-        # Calculate speed of sound
-        self.calculateSpeedOfSoundProfile()
+        return None
 
-        # Update dynamic viscosity
-        self.calculateDynamicViscosity()
+    def __processLatestForecast(self, model, preset, process):
+        """Processes the latest available cycle of a default forecast or
+        ensemble, stepping back one cycle at a time for up to 10 attempts.
 
-        return None
+        Parameters
+        ----------
+        model : string
+            Name of the default forecast, such as "GFS" or "GEFS".
+        preset : tuple
+            Url formatter, which receives year, month, day and cycle hour,
+            dictionary and cycle length in hours of the model.
+        process : callable
+            Method used to process the file, such as
+            Environment.processForecastReanalysis.
+
+        Returns
+        -------
+        file : string
+            Url of the processed file.
+        dictionary : dictionary
+            Dictionary used to read the file.
+        """
+        formatUrl, dictionary, cycleHours = preset
+        # Attempt to get latest forecast, starting from the current cycle
+        timeNow = datetime.now(timezone.utc)
+        timeStart = timeNow.replace(
+            hour=cycleHours * (timeNow.hour // cycleHours),
+            minute=0,
+            second=0,
+            microsecond=0,
+        )
+        for attemptCount in range(10):
+            timeAttempt = timeStart - timedelta(hours=cycleHours * attemptCount)
+            file = formatUrl(
+                timeAttempt.year, timeAttempt.month, timeAttempt.day, timeAttempt.hour
+            )
+            try:
+                process(file, dictionary)
+                return file, dictionary
+            except OSError:
+                pass
+        raise RuntimeError(
+            "Unable to load latest weather data for " + model + " through " + file
+        )
 
     def processStandardAtmosphere(self):
         """Sets pressure and temperature profiles corresponding to the
@@ -1364,7 +1644,7 @@ class Environment:
             )
             # Check maximum height of custom pressure input
             if not callable(self.pressure.source):
-                maxExpectedHeight = max(self.pressure[-1, 0], maxExpectedHeight)
+                maxExpectedHeight = max(self.pressure.source[-1, 0], maxExpectedHeight)
 
         # Save temperature profile
         if temperature is None:
@@ -1379,7 +1659,9 @@ class Environment:
             )
             # Check maximum height of custom temperature input
             if not callable(self.temperature.source):
-                maxExpectedHeight = max(self.temperature[-1, 0], maxExpectedHeight)
+                maxExpectedHeight = max(
+                    self.temperature.source[-1, 0], maxExpectedHeight
+                )
 
         # Save wind profile
         self.windVelocityX = Function(
@@ -1396,36 +1678,35 @@ class Environment:
         )
         # Check maximum height of custom wind input
         if not callable(self.windVelocityX.source):
-            maxExpectedHeight = max(self.windVelocityX[-1, 0], maxExpectedHeight)
+            maxExpectedHeight = max(self.windVelocityX.source[-1, 0], maxExpectedHeight)
         if not callable(self.windVelocityY.source):
-            maxExpectedHeight = max(self.windVelocityY[-1, 0], maxExpectedHeight)
+            maxExpectedHeight = max(self.windVelocityY.source[-1, 0], maxExpectedHeight)
+
+        # Compute wind profile direction, heading and speed, evaluated on
+        # demand so that they are exact between the wind input heights, for
+        # single heights or whole arrays of heights
+        def windHeading(h):
+            windU, windV = self.windVelocityX(h), self.windVelocityY(h)
+            return np.rad2deg(np.arctan2(windU, windV)) % 360
+
+        def windDirection(h):
+            return (windHeading(h) - 180) % 360
+
+        def windSpeed(h):
+            return np.hypot(self.windVelocityX(h), self.windVelocityY(h))
 
-        # Compute wind profile direction and heading
-        windHeading = (
-            lambda h: np.arctan2(self.windVelocityX(h), self.windVelocityY(h))
-            * (180 / np.pi)
-            % 360
-        )
         self.windHeading = Function(
             windHeading,
             inputs="Height Above Sea Level (m)",
             outputs="Wind Heading (Deg True)",
             interpolation="linear",
         )
-
-        def windDirection(h):
-            return (windHeading(h) - 180) % 360
-
         self.windDirection = Function(
             windDirection,
             inputs="Height Above Sea Level (m)",
             outputs="Wind Direction (Deg True)",
             interpolation="linear",
         )
-
-        def windSpeed(h):
-            return np.sqrt(self.windVelocityX(h) ** 2 + self.windVelocityY(h) ** 2)
-
         self.windSpeed = Function(
             windSpeed,
             inputs="Height Above Sea Level (m)",
@@ -1456,7 +1737,7 @@ class Environment:
         # Load data from Windy.com: json file
         url = f"https://node.windy.com/forecast/meteogram/{model}/{self.lat}/{self.lon}/?step=undefined"
         try:
-            response = requests.get(url).json()
+            response = _loads(_SESSION.get(url, timeout=30).content)
         except:
             if model == "iconEu":
                 raise ValueError(
@@ -1467,7 +1748,7 @@ class Environment:
         # Determine time index from model
         timeArray = np.array(response["data"]["hours"])
         timeUnits = "milliseconds since 1970-01-01 00:00:00"
-        launchTimeInUnits = netCDF4.date2num(self.date, timeUnits)
+        launchTimeInUnits = self.date.timestamp() * 1000
         # Find the index of the closest time in timeArray to the launch time
         timeIndex = (np.abs(timeArray - launchTimeInUnits)).argmin()
 
@@ -1476,85 +1757,74 @@ class Environment:
             [1000, 950, 925, 900, 850, 800, 700, 600, 500, 400, 300, 250, 200, 150]
         )
 
+        # Read one variable at every pressure level for the selected time
+        data = response["data"]
+
+        def readLevels(variable):
+            return np.fromiter(
+                (data[f"{variable}-{pL}h"][timeIndex] for pL in pressureLevels),
+                dtype=float,
+                count=len(pressureLevels),
+            )
+
         # Process geopotential height array
-        geopotentialHeightArray = np.array(
-            [response["data"][f"gh-{pL}h"][timeIndex] for pL in pressureLevels]
-        )
+        geopotentialHeightArray = readLevels("gh")
         # Convert geopotential height to geometric altitude (ASL)
         R = self.earthRadius
-        altitudeArray = R * geopotentialHeightArray / (R - geopotentialHeightArray)
+        altitudeArray = R * geopotentialHeightArray
+        altitudeArray /= R - geopotentialHeightArray
 
         # Process temperature array (in Kelvin)
-        temperatureArray = np.array(
-            [response["data"][f"temp-{pL}h"][timeIndex] for pL in pressureLevels]
-        )
+        temperatureArray = readLevels("temp")
 
         # Process wind-u and wind-v array (in m/s)
-        windUArray = np.array(
-            [response["data"][f"wind_u-{pL}h"][timeIndex] for pL in pressureLevels]
-        )
-        windVArray = np.array(
-            [response["data"][f"wind_v-{pL}h"][timeIndex] for pL in pressureLevels]
-        )
+        windUArray = readLevels("wind_u")
+        windVArray = readLevels("wind_v")
 
         # Determine wind speed, heading and direction
-        windSpeedArray = np.sqrt(windUArray**2 + windVArray**2)
-        windHeadingArray = np.arctan2(windUArray, windVArray) * (180 / np.pi) % 360
+        windSpeedArray = np.hypot(windUArray, windVArray)
+        windHeadingArray = np.rad2deg(np.arctan2(windUArray, windVArray)) % 360
         windDirectionArray = (windHeadingArray - 180) % 360
 
-        # Combine all data into big array
-        data_array = np.ma.column_stack(
-            [
-                100 * pressureLevels,  # Convert hPa to Pa
-                altitudeArray,
-                temperatureArray,
-                windUArray,
-                windVArray,
-                windHeadingArray,
-                windDirectionArray,
-                windSpeedArray,
-            ]
-        )
-
-        # Save atmospheric data
+        # Save atmospheric data, pairing each profile with the altitudes
         self.pressure = Function(
-            data_array[:, (1, 0)],
+            np.column_stack([altitudeArray, 100 * pressureLevels]),  # hPa to Pa
             inputs="Height Above Sea Level (m)",
             outputs="Pressure (Pa)",
             interpolation="linear",
         )
         self.temperature = Function(
-            data_array[:, (1, 2)],
+            np.column_stack([altitudeArray, temperatureArray]),
             inputs="Height Above Sea Level (m)",
             outputs="Temperature (K)",
             interpolation="linear",
         )
         self.windDirection = Function(
-            data_array[:, (1, 6)],
+            np.column_stack([altitudeArray, windDirectionArray]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Direction (Deg True)",
             interpolation="linear",
         )
         self.windHeading = Function(
-            data_array[:, (1, 5)],
+            np.column_stack([altitudeArray, windHeadingArray]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Heading (Deg True)",
             interpolation="linear",
         )
         self.windSpeed = Function(
-            data_array[:, (1, 7)],
+            np.column_stack([altitudeArray, windSpeedArray]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Speed (m/s)",
             interpolation="linear",
         )
         self.windVelocityX = Function(
-            data_array[:, (1, 3)],
+            np.column_stack([altitudeArray, windUArray]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Velocity X (m/s)",
             interpolation="linear",
         )
         self.windVelocityY = Function(
-            data_array[:, (1, 4)],
+            np.column_stack([altitudeArray, windVArray]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Velocity Y (m/s)",
             interpolation="linear",
@@ -1606,13 +1876,13 @@ class Environment:
         None
         """
         # Request Wyoming Sounding from file url
-        response = requests.get(file)
+        response = _SESSION.get(file, timeout=30)
         if response.status_code != 200:
             raise ImportError("Unable to load " + file + ".")
-        if len(re.findall("Can't get .+ Observations at", response.text)):
+        noObservations = _NO_OBSERVATIONS_RE.search(response.text)
+        if noObservations:
             raise ValueError(
-                re.findall("Can't get .+ Observations at .+", response.text)[0]
-                + " Check station number and date."
+                noObservations.group(0) + " Check station number and date."
             )
         if response.text == "Invalid OUTPUT: specified\n":
             raise ValueError(
@@ -1620,21 +1890,21 @@ class Environment:
             )
 
         # Process Wyoming Souding by finding data table and station info
-        response_split_text = re.split("(<.{0,1}PRE>)", response.text)
+        response_split_text = _PRE_TAG_RE.split(response.text)
         data_table = response_split_text[2]
         station_info = response_split_text[6]
 
-        # Transform data table into np array
-        data_array = []
-        for line in data_table.split("\n")[
-            5:-1
-        ]:  # Split data table into lines and remove header and footer
-            columns = re.split(" +", line)  # Split line into columns
-            if (
-                len(columns) == 12
-            ):  # 12 is the number of column entries when all entries are given
-                data_array.append(columns[1:])
-        data_array = np.array(data_array, dtype=float)
+        # Transform data table into np array, removing header and footer and
+        # skipping rows where not all of the 11 column entries are given
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            data_array = np.genfromtxt(
+                data_table.split("\n")[5:-1],
+                dtype=float,
+                usecols=range(11),
+                invalid_raise=False,
+            )
+        data_array = np.atleast_2d(data_array)
 
         # Retrieve pressure from data array
         data_array[:, 0] = 100 * data_array[:, 0]  # Converts hPa to Pa
@@ -1659,8 +1929,9 @@ class Environment:
         data_array[:, 5] = (
             data_array[:, 6] + 180
         ) % 360  # Convert wind direction to wind heading
-        data_array[:, 3] = data_array[:, 7] * np.sin(data_array[:, 5] * np.pi / 180)
-        data_array[:, 4] = data_array[:, 7] * np.cos(data_array[:, 5] * np.pi / 180)
+        windHeadingRad = np.deg2rad(data_array[:, 5])
+        data_array[:, 3] = data_array[:, 7] * np.sin(windHeadingRad)
+        data_array[:, 4] = data_array[:, 7] * np.cos(windHeadingRad)
 
         # Convert geopotential height to geometric height
         R = self.earthRadius
@@ -1702,9 +1973,7 @@ class Environment:
         station_elevation_text = station_info.split("\n")[6]
 
         # Convert station elevation text into float value
-        self.elevation = float(
-            re.findall(r"[0-9]+\.[0-9]+|[0-9]+", station_elevation_text)[0]
-        )
+        self.elevation = float(_NUMBER_RE.findall(station_elevation_text)[0])
 
         # Save maximum expected height
         self.maxExpectedHeight = data_array[-1, 1]
@@ -1732,7 +2001,7 @@ class Environment:
         None
         """
         # Request NOAA Ruc Sounding from file url
-        response = requests.get(file)
+        response = _SESSION.get(file, timeout=30)
         if response.status_code != 200 or len(response.text) < 10:
             raise ImportError("Unable to load " + file + ".")
 
@@ -1741,71 +2010,33 @@ class Environment:
 
         # Process GSD format (https://rucsoundings.noaa.gov/raob_format.html)
 
-        # Extract elevation data
+        # Extract elevation and sounding levels in a single pass
+        levels = []
         for line in lines:
             # Split line into columns
-            columns = re.split(" +", line)[1:]
+            columns = line.split()
             if len(columns) > 0:
                 if columns[0] == "1" and columns[5] != "99999":
                     # Save elevation
                     self.elevation = float(columns[5])
-                else:
-                    # No elevation data available
-                    pass
+                elif len(columns) >= 6 and columns[0] in ["4", "5", "6", "7", "8", "9"]:
+                    # Save level, with columns converted to floats later on
+                    levels.append(columns[:7])
+        levels = np.array(levels, dtype=float)
 
-        # Extract pressure as a function of height
-        pressure_array = []
-        for line in lines:
-            # Split line into columns
-            columns = re.split(" +", line)[1:]
-            if len(columns) >= 6:
-                if columns[0] in ["4", "5", "6", "7", "8", "9"]:
-                    # Convert columns to floats
-                    columns = np.array(columns, dtype=float)
-                    # Select relevant columns
-                    columns = columns[[2, 1]]
-                    # Check if values exist
-                    if max(columns) != 99999:
-                        # Save value
-                        pressure_array.append(columns)
-        pressure_array = np.array(pressure_array)
-
-        # Extract temperature as a function of height
-        temperature_array = []
-        for line in lines:
-            # Split line into columns
-            columns = re.split(" +", line)[1:]
-            if len(columns) >= 6:
-                if columns[0] in ["4", "5", "6", "7", "8", "9"]:
-                    # Convert columns to floats
-                    columns = np.array(columns, dtype=float)
-                    # Select relevant columns
-                    columns = columns[[2, 3]]
-                    # Check if values exist
-                    if max(columns) != 99999:
-                        # Save value
-                        temperature_array.append(columns)
-        temperature_array = np.array(temperature_array)
+        # Extract pressure as a function of height, where values exist
+        pressure_array = levels[:, [2, 1]]
+        pressure_array = pressure_array[pressure_array.max(axis=1) != 99999]
+
+        # Extract temperature as a function of height, where values exist
+        temperature_array = levels[:, [2, 3]]
+        temperature_array = temperature_array[temperature_array.max(axis=1) != 99999]
 
         # Extract wind speed and direction as a function of height
-        windSpeed_array = []
-        windDirection_array = []
-        for line in lines:
-            # Split line into columns
-            columns = re.split(" +", line)[1:]
-            if len(columns) >= 6:
-                if columns[0] in ["4", "5", "6", "7", "8", "9"]:
-                    # Convert columns to floats
-                    columns = np.array(columns, dtype=float)
-                    # Select relevant columns
-                    columns = columns[[2, 5, 6]]
-                    # Check if values exist
-                    if max(columns) != 99999:
-                        # Save value
-                        windDirection_array.append(columns[[0, 1]])
-                        windSpeed_array.append(columns[[0, 2]])
-        windSpeed_array = np.array(windSpeed_array)
-        windDirection_array = np.array(windDirection_array)
+        wind_array = levels[:, [2, 5, 6]]
+        wind_array = wind_array[wind_array.max(axis=1) != 99999]
+        windDirection_array = wind_array[:, [0, 1]]
+        windSpeed_array = wind_array[:, [0, 2]]
 
         # Converts 10*hPa to Pa and save values
         pressure_array[:, 1] = 10 * pressure_array[:, 1]
@@ -1831,18 +2062,15 @@ class Environment:
         windSpeed_array[:, 1] = (
             windSpeed_array[:, 1] * 1.852 / 3.6
         )  # Converts Knots to m/s
-        windHeading_array = windDirection_array[:, :] * 1
+        windHeading_array = windDirection_array.copy()
         windHeading_array[:, 1] = (
             windDirection_array[:, 1] + 180
         ) % 360  # Convert wind direction to wind heading
-        windU = windSpeed_array[:, :] * 1
-        windV = windSpeed_array[:, :] * 1
-        windU[:, 1] = windSpeed_array[:, 1] * np.sin(
-            windHeading_array[:, 1] * np.pi / 180
-        )
-        windV[:, 1] = windSpeed_array[:, 1] * np.cos(
-            windHeading_array[:, 1] * np.pi / 180
-        )
+        windU = windSpeed_array.copy()
+        windV = windSpeed_array.copy()
+        windHeadingRad = np.deg2rad(windHeading_array[:, 1])
+        windU[:, 1] = windSpeed_array[:, 1] * np.sin(windHeadingRad)
+        windV[:, 1] = windSpeed_array[:, 1] * np.cos(windHeadingRad)
 
         # Save wind data
         self.windDirection = Function(
@@ -1879,6 +2107,34 @@ class Environment:
         # Save maximum expected height
         self.maxExpectedHeight = pressure_array[-1, 0]
 
+    @_cache_weather_dataset(
+        "pressure",
+        "temperature",
+        "windDirection",
+        "windHeading",
+        "windSpeed",
+        "windVelocityX",
+        "windVelocityY",
+        "maxExpectedHeight",
+        "atmosphericModelInitDate",
+        "atmosphericModelEndDate",
+        "atmosphericModelInterval",
+        "atmosphericModelInitLat",
+        "atmosphericModelEndLat",
+        "atmosphericModelInitLon",
+        "atmosphericModelEndLon",
+        "latArray",
+        "lonArray",
+        "lonIndex",
+        "latIndex",
+        "geopotentials",
+        "windUs",
+        "windVs",
+        "levels",
+        "temperatures",
+        "timeArray",
+        "height",
+    )
     @requires_netCDF4
     def processForecastReanalysis(self, file, dictionary):
         """Import and process atmospheric data from weather forecasts
@@ -1952,20 +2208,23 @@ class Environment:
 
         # Get time, latitude and longitude data from file
         timeArray = weatherData.variables[dictionary["time"]]
-        lonArray = weatherData.variables[dictionary["longitude"]][:].tolist()
-        latArray = weatherData.variables[dictionary["latitude"]][:].tolist()
-
-        # Find time index
-        timeIndex = netCDF4.date2index(
-            self.date, timeArray, calendar="gregorian", select="nearest"
+        lonArray = np.array(
+            weatherData.variables[dictionary["longitude"]][:], dtype=float
         )
-        # Convert times do dates and numbers
+        latArray = np.array(
+            weatherData.variables[dictionary["latitude"]][:], dtype=float
+        )
+
+        # Find time index, nearest to launch time
+        times = timeArray[:]
         inputTimeNum = netCDF4.date2num(
             self.date, timeArray.units, calendar="gregorian"
         )
-        fileTimeNum = timeArray[timeIndex]
+        timeIndex = int(np.abs(times - inputTimeNum).argmin())
+        # Convert times do dates and numbers
+        fileTimeNum = times[timeIndex]
         fileTimeDate = netCDF4.num2date(
-            timeArray[timeIndex], timeArray.units, calendar="gregorian"
+            fileTimeNum, timeArray.units, calendar="gregorian"
         )
         # Check if time is inside range supplied by file
         if timeIndex == 0 and inputTimeNum < fileTimeNum:
@@ -1991,25 +2250,23 @@ class Environment:
         # Find longitude index
         # Determine if file uses -180 to 180 or 0 to 360
         if lonArray[0] < 0 or lonArray[-1] < 0:
-            # Convert input to -180 - 180
-            lon = self.lon if self.lon < 180 else -180 + self.lon % 180
+            # Convert input to -180 - 180, so that 360 maps to 0 and 180 to -180
+            lon = (self.lon + 180) % 360 - 180
         else:
             # Convert input to 0 - 360
             lon = self.lon % 360
         # Check if reversed or sorted
         if lonArray[0] < lonArray[-1]:
             # Deal with sorted lonArray
-            lonIndex = bisect.bisect(lonArray, lon)
+            lonIndex = int(np.searchsorted(lonArray, lon, side="right"))
         else:
-            # Deal with reversed lonArray
-            lonArray.reverse()
-            lonIndex = len(lonArray) - bisect.bisect_left(lonArray, lon)
-            lonArray.reverse()
+            # Deal with reversed lonArray through an ascending view
+            lonIndex = len(lonArray) - int(np.searchsorted(lonArray[::-1], lon))
         # Take care of longitude value equal to maximum longitude in the grid
         if lonIndex == len(lonArray) and lonArray[lonIndex - 1] == lon:
             lonIndex = lonIndex - 1
         # Check if longitude value is inside the grid
-        if lonIndex == 0 or lonIndex == len(lonArray):
+        if not 0 < lonIndex < len(lonArray):
             raise ValueError(
                 "Longitude {:f} not inside region covered by file, which is from {:f} to {:f}.".format(
                     lon, lonArray[0], lonArray[-1]
@@ -2020,17 +2277,15 @@ class Environment:
         # Check if reversed or sorted
         if latArray[0] < latArray[-1]:
             # Deal with sorted latArray
-            latIndex = bisect.bisect(latArray, self.lat)
+            latIndex = int(np.searchsorted(latArray, self.lat, side="right"))
         else:
-            # Deal with reversed latArray
-            latArray.reverse()
-            latIndex = len(latArray) - bisect.bisect_left(latArray, self.lat)
-            latArray.reverse()
+            # Deal with reversed latArray through an ascending view
+            latIndex = len(latArray) - int(np.searchsorted(latArray[::-1], self.lat))
         # Take care of latitude value equal to maximum longitude in the grid
         if latIndex == len(latArray) and latArray[latIndex - 1] == self.lat:
             latIndex = latIndex - 1
         # Check if latitude value is inside the grid
-        if latIndex == 0 or latIndex == len(latArray):
+        if not 0 < latIndex < len(latArray):
             raise ValueError(
                 "Latitude {:f} not inside region covered by file, which is from {:f} to {:f}.".format(
                     self.lat, latArray[0], latArray[-1]
@@ -2039,41 +2294,39 @@ class Environment:
 
         # Get pressure level data from file
         try:
-            levels = (
-                100 * weatherData.variables[dictionary["level"]][:]
-            )  # Convert mbar to Pa
-        except:
+            levels = weatherData.variables[dictionary["level"]][:]
+        except _NETCDF_READ_ERRORS:
             raise ValueError(
                 "Unable to read pressure levels from file. Check file and dictionary."
             )
+        levels = 100 * levels  # Convert mbar to Pa
 
         # Get geopotential data from file
         try:
-            geopotentials = weatherData.variables[dictionary["geopotential_height"]][
-                timeIndex, :, (latIndex - 1, latIndex), (lonIndex - 1, lonIndex)
+            if dictionary.get("geopotential_height") in weatherData.variables:
+                variable = weatherData.variables[dictionary["geopotential_height"]]
+                scale = 1
+            else:
+                variable = weatherData.variables[dictionary["geopotential"]]
+                scale = self.g
+            geopotentials = variable[
+                timeIndex, :, latIndex - 1 : latIndex + 1, lonIndex - 1 : lonIndex + 1
             ]
-        except:
-            try:
-                geopotentials = (
-                    weatherData.variables[dictionary["geopotential"]][
-                        timeIndex, :, (latIndex - 1, latIndex), (lonIndex - 1, lonIndex)
-                    ]
-                    / self.g
-                )
-            except:
-                raise ValueError(
-                    "Unable to read geopontential height"
-                    " nor geopotential from file. At least"
-                    " one of them is necessary. Check "
-                    " file and dictionary."
-                )
+        except _NETCDF_READ_ERRORS:
+            raise ValueError(
+                "Unable to read geopontential height"
+                " nor geopotential from file. At least"
+                " one of them is necessary. Check "
+                " file and dictionary."
+            )
+        geopotentials = geopotentials / scale
 
         # Get temperature from file
         try:
             temperatures = weatherData.variables[dictionary["temperature"]][
-                timeIndex, :, (latIndex - 1, latIndex), (lonIndex - 1, lonIndex)
+                timeIndex, :, latIndex - 1 : latIndex + 1, lonIndex - 1 : lonIndex + 1
             ]
-        except:
+        except _NETCDF_READ_ERRORS:
             raise ValueError(
                 "Unable to read temperature from file. Check file and dictionary."
             )
@@ -2081,17 +2334,17 @@ class Environment:
         # Get wind data from file
         try:
             windUs = weatherData.variables[dictionary["u_wind"]][
-                timeIndex, :, (latIndex - 1, latIndex), (lonIndex - 1, lonIndex)
+                timeIndex, :, latIndex - 1 : latIndex + 1, lonIndex - 1 : lonIndex + 1
             ]
-        except:
+        except _NETCDF_READ_ERRORS:
             raise ValueError(
                 "Unable to read wind-u component. Check file and dictionary."
             )
         try:
             windVs = weatherData.variables[dictionary["v_wind"]][
-                timeIndex, :, (latIndex - 1, latIndex), (lonIndex - 1, lonIndex)
+                timeIndex, :, latIndex - 1 : latIndex + 1, lonIndex - 1 : lonIndex + 1
             ]
-        except:
+        except _NETCDF_READ_ERRORS:
             raise ValueError(
                 "Unable to read wind-v component. Check file and dictionary."
             )
@@ -2100,55 +2353,45 @@ class Environment:
         x, y = self.lat, lon
         x1, y1 = latArray[latIndex - 1], lonArray[lonIndex - 1]
         x2, y2 = latArray[latIndex], lonArray[lonIndex]
+        weights = _bilinear_weights(x, x1, x2, y, y1, y2)
 
         # Determine geopotential in lat, lon
-        f_x1_y1 = geopotentials[:, 0, 0]
-        f_x1_y2 = geopotentials[:, 0, 1]
-        f_x2_y1 = geopotentials[:, 1, 0]
-        f_x2_y2 = geopotentials[:, 1, 1]
-        f_x_y1 = ((x2 - x) / (x2 - x1)) * f_x1_y1 + ((x - x1) / (x2 - x1)) * f_x2_y1
-        f_x_y2 = ((x2 - x) / (x2 - x1)) * f_x1_y2 + ((x - x1) / (x2 - x1)) * f_x2_y2
-        height = ((y2 - y) / (y2 - y1)) * f_x_y1 + ((y - y1) / (y2 - y1)) * f_x_y2
+        height = _bilinear_interpolation(geopotentials, weights)
 
         # Determine temperature in lat, lon
-        f_x1_y1 = temperatures[:, 0, 0]
-        f_x1_y2 = temperatures[:, 0, 1]
-        f_x2_y1 = temperatures[:, 1, 0]
-        f_x2_y2 = temperatures[:, 1, 1]
-        f_x_y1 = ((x2 - x) / (x2 - x1)) * f_x1_y1 + ((x - x1) / (x2 - x1)) * f_x2_y1
-        f_x_y2 = ((x2 - x) / (x2 - x1)) * f_x1_y2 + ((x - x1) / (x2 - x1)) * f_x2_y2
-        temperature = ((y2 - y) / (y2 - y1)) * f_x_y1 + ((y - y1) / (y2 - y1)) * f_x_y2
+        temperature = _bilinear_interpolation(temperatures, weights)
 
         # Determine wind u in lat, lon
-        f_x1_y1 = windUs[:, 0, 0]
-        f_x1_y2 = windUs[:, 0, 1]
-        f_x2_y1 = windUs[:, 1, 0]
-        f_x2_y2 = windUs[:, 1, 1]
-        f_x_y1 = ((x2 - x) / (x2 - x1)) * f_x1_y1 + ((x - x1) / (x2 - x1)) * f_x2_y1
-        f_x_y2 = ((x2 - x) / (x2 - x1)) * f_x1_y2 + ((x - x1) / (x2 - x1)) * f_x2_y2
-        windU = ((y2 - y) / (y2 - y1)) * f_x_y1 + ((y - y1) / (y2 - y1)) * f_x_y2
+        windU = _bilinear_interpolation(windUs, weights)
 
         # Determine wind v in lat, lon
-        f_x1_y1 = windVs[:, 0, 0]
-        f_x1_y2 = windVs[:, 0, 1]
-        f_x2_y1 = windVs[:, 1, 0]
-        f_x2_y2 = windVs[:, 1, 1]
-        f_x_y1 = ((x2 - x) / (x2 - x1)) * f_x1_y1 + ((x - x1) / (x2 - x1)) * f_x2_y1
-        f_x_y2 = ((x2 - x) / (x2 - x1)) * f_x1_y2 + ((x - x1) / (x2 - x1)) * f_x2_y2
-        windV = ((y2 - y) / (y2 - y1)) * f_x_y1 + ((y - y1) / (y2 - y1)) * f_x_y2
+        windV = _bilinear_interpolation(windVs, weights)
 
         # Determine wind speed, heading and direction
-        windSpeed = np.sqrt(windU**2 + windV**2)
-        windHeading = np.arctan2(windU, windV) * (180 / np.pi) % 360
-        windDirection = (windHeading - 180) % 360
+        windSpeed = np.hypot(windU, windV)
+        windHeading = np.rad2deg(np.arctan2(windU, windV)) % 360
+        windDirection = (windHeading + 180) % 360
 
         # Convert geopotential height to geometric height
         R = self.earthRadius
-        height = R * height / (R - height)
-
-        # Combine all data into big array
-        data_array = np.ma.column_stack(
-            [
+        denominator = R - height
+        height *= R
+        height /= denominator
+
+        # Remove pressure levels with masked content
+        profiles = [
+            levels,
+            height,
+            temperature,
+            windU,
+            windV,
+            windHeading,
+            windDirection,
+            windSpeed,
+        ]
+        mask = np.logical_or.reduce([np.ma.getmaskarray(p) for p in profiles])
+        if mask.any():
+            (
                 levels,
                 height,
                 temperature,
@@ -2157,54 +2400,49 @@ class Environment:
                 windHeading,
                 windDirection,
                 windSpeed,
-            ]
-        )
-
-        # Remove lines with masked content
-        if np.any(data_array.mask):
-            data_array = np.ma.compress_rows(data_array)
+            ) = [np.ma.getdata(p)[~mask] for p in profiles]
             warnings.warn(
                 "Some values were missing from this weather dataset, therefore, certain pressure levels were removed."
             )
         # Save atmospheric data
         self.pressure = Function(
-            data_array[:, (1, 0)],
+            np.column_stack([height, levels]),
             inputs="Height Above Sea Level (m)",
             outputs="Pressure (Pa)",
             interpolation="linear",
         )
         self.temperature = Function(
-            data_array[:, (1, 2)],
+            np.column_stack([height, temperature]),
             inputs="Height Above Sea Level (m)",
             outputs="Temperature (K)",
             interpolation="linear",
         )
         self.windDirection = Function(
-            data_array[:, (1, 6)],
+            np.column_stack([height, windDirection]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Direction (Deg True)",
             interpolation="linear",
         )
         self.windHeading = Function(
-            data_array[:, (1, 5)],
+            np.column_stack([height, windHeading]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Heading (Deg True)",
             interpolation="linear",
         )
         self.windSpeed = Function(
-            data_array[:, (1, 7)],
+            np.column_stack([height, windSpeed]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Speed (m/s)",
             interpolation="linear",
         )
         self.windVelocityX = Function(
-            data_array[:, (1, 3)],
+            np.column_stack([height, windU]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Velocity X (m/s)",
             interpolation="linear",
         )
         self.windVelocityY = Function(
-            data_array[:, (1, 4)],
+            np.column_stack([height, windV]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Velocity Y (m/s)",
             interpolation="linear",
@@ -2218,37 +2456,22 @@ class Environment:
             try:
                 elevations = weatherData.variables[
                     dictionary["surface_geopotential_height"]
-                ][timeIndex, (latIndex - 1, latIndex), (lonIndex - 1, lonIndex)]
-                f_x1_y1 = elevations[0, 0]
-                f_x1_y2 = elevations[0, 1]
-                f_x2_y1 = elevations[1, 0]
-                f_x2_y2 = elevations[1, 1]
-                f_x_y1 = ((x2 - x) / (x2 - x1)) * f_x1_y1 + (
-                    (x - x1) / (x2 - x1)
-                ) * f_x2_y1
-                f_x_y2 = ((x2 - x) / (x2 - x1)) * f_x1_y2 + (
-                    (x - x1) / (x2 - x1)
-                ) * f_x2_y2
-                self.elevation = ((y2 - y) / (y2 - y1)) * f_x_y1 + (
-                    (y - y1) / (y2 - y1)
-                ) * f_x_y2
-            except:
+                ][timeIndex, latIndex - 1 : latIndex + 1, lonIndex - 1 : lonIndex + 1]
+            except _NETCDF_READ_ERRORS:
                 raise ValueError(
                     "Unable to read surface elevation data. Check file and dictionary."
                 )
+            self.elevation = _bilinear_interpolation(elevations, weights)
 
-        # Compute info data
-        self.atmosphericModelInitDate = netCDF4.num2date(
-            timeArray[0], timeArray.units, calendar="gregorian"
-        )
-        self.atmosphericModelEndDate = netCDF4.num2date(
-            timeArray[-1], timeArray.units, calendar="gregorian"
-        )
-        self.atmosphericModelInterval = netCDF4.num2date(
-            (timeArray[-1] - timeArray[0]) / (len(timeArray) - 1),
+        # Compute info data, converting all times in a single call
+        initDate, endDate, interval = netCDF4.num2date(
+            np.array([times[0], times[-1], (times[-1] - times[0]) / (len(times) - 1)]),
             timeArray.units,
             calendar="gregorian",
-        ).hour
+        )
+        self.atmosphericModelInitDate = initDate
+        self.atmosphericModelEndDate = endDate
+        self.atmosphericModelInterval = interval.hour
         self.atmosphericModelInitLat = latArray[0]
         self.atmosphericModelEndLat = latArray[-1]
         self.atmosphericModelInitLon = lonArray[0]
@@ -2264,7 +2487,7 @@ class Environment:
         self.windVs = windVs
         self.levels = levels
         self.temperatures = temperatures
-        self.timeArray = timeArray
+        self.timeArray = times
         self.height = height
 
         # Close weather data
@@ -2272,6 +2495,44 @@ class Environment:
 
         return None
 
+    @_cache_weather_dataset(
+        "levelEnsemble",
+        "heightEnsemble",
+        "temperatureEnsemble",
+        "windUEnsemble",
+        "windVEnsemble",
+        "numEnsembleMembers",
+        "ensembleMember",
+        "pressure",
+        "temperature",
+        "windDirection",
+        "windHeading",
+        "windSpeed",
+        "windVelocityX",
+        "windVelocityY",
+        "maxExpectedHeight",
+        "atmosphericModelInitDate",
+        "atmosphericModelEndDate",
+        "atmosphericModelInterval",
+        "atmosphericModelInitLat",
+        "atmosphericModelEndLat",
+        "atmosphericModelInitLon",
+        "atmosphericModelEndLon",
+        "latArray",
+        "lonArray",
+        "lonIndex",
+        "latIndex",
+        "geopotentials",
+        "windUs",
+        "windVs",
+        "levels",
+        "temperatures",
+        "timeArray",
+        "height",
+        "density",
+        "speedOfSound",
+        "dynamicViscosity",
+    )
     @requires_netCDF4
     def processEnsemble(self, file, dictionary):
         """Import and process atmospheric data from weather ensembles
@@ -2347,20 +2608,23 @@ class Environment:
 
         # Get time, latitude and longitude data from file
         timeArray = weatherData.variables[dictionary["time"]]
-        lonArray = weatherData.variables[dictionary["longitude"]][:].tolist()
-        latArray = weatherData.variables[dictionary["latitude"]][:].tolist()
-
-        # Find time index
-        timeIndex = netCDF4.date2index(
-            self.date, timeArray, calendar="gregorian", select="nearest"
+        lonArray = np.array(
+            weatherData.variables[dictionary["longitude"]][:], dtype=float
         )
-        # Convert times do dates and numbers
+        latArray = np.array(
+            weatherData.variables[dictionary["latitude"]][:], dtype=float
+        )
+
+        # Find time index, nearest to launch time
+        times = timeArray[:]
         inputTimeNum = netCDF4.date2num(
             self.date, timeArray.units, calendar="gregorian"
         )
-        fileTimeNum = timeArray[timeIndex]
+        timeIndex = int(np.abs(times - inputTimeNum).argmin())
+        # Convert times do dates and numbers
+        fileTimeNum = times[timeIndex]
         fileTimeDate = netCDF4.num2date(
-            timeArray[timeIndex], timeArray.units, calendar="gregorian"
+            fileTimeNum, timeArray.units, calendar="gregorian"
         )
         # Check if time is inside range supplied by file
         if timeIndex == 0 and inputTimeNum < fileTimeNum:
@@ -2386,25 +2650,23 @@ class Environment:
         # Find longitude index
         # Determine if file uses -180 to 180 or 0 to 360
         if lonArray[0] < 0 or lonArray[-1] < 0:
-            # Convert input to -180 - 180
-            lon = self.lon if self.lon < 180 else -180 + self.lon % 180
+            # Convert input to -180 - 180, so that 360 maps to 0 and 180 to -180
+            lon = (self.lon + 180) % 360 - 180
         else:
             # Convert input to 0 - 360
             lon = self.lon % 360
         # Check if reversed or sorted
         if lonArray[0] < lonArray[-1]:
             # Deal with sorted lonArray
-            lonIndex = bisect.bisect(lonArray, lon)
+            lonIndex = int(np.searchsorted(lonArray, lon, side="right"))
         else:
-            # Deal with reversed lonArray
-            lonArray.reverse()
-            lonIndex = len(lonArray) - bisect.bisect_left(lonArray, lon)
-            lonArray.reverse()
+            # Deal with reversed lonArray through an ascending view
+            lonIndex = len(lonArray) - int(np.searchsorted(lonArray[::-1], lon))
         # Take care of longitude value equal to maximum longitude in the grid
         if lonIndex == len(lonArray) and lonArray[lonIndex - 1] == lon:
             lonIndex = lonIndex - 1
         # Check if longitude value is inside the grid
-        if lonIndex == 0 or lonIndex == len(lonArray):
+        if not 0 < lonIndex < len(lonArray):
             raise ValueError(
                 "Longitude {:f} not inside region covered by file, which is from {:f} to {:f}.".format(
                     lon, lonArray[0], lonArray[-1]
@@ -2415,17 +2677,15 @@ class Environment:
         # Check if reversed or sorted
         if latArray[0] < latArray[-1]:
             # Deal with sorted latArray
-            latIndex = bisect.bisect(latArray, self.lat)
+            latIndex = int(np.searchsorted(latArray, self.lat, side="right"))
         else:
-            # Deal with reversed latArray
-            latArray.reverse()
-            latIndex = len(latArray) - bisect.bisect_left(latArray, self.lat)
-            latArray.reverse()
+            # Deal with reversed latArray through an ascending view
+            latIndex = len(latArray) - int(np.searchsorted(latArray[::-1], self.lat))
         # Take care of latitude value equal to maximum longitude in the grid
         if latIndex == len(latArray) and latArray[latIndex - 1] == self.lat:
             latIndex = latIndex - 1
         # Check if latitude value is inside the grid
-        if latIndex == 0 or latIndex == len(latArray):
+        if not 0 < latIndex < len(latArray):
             raise ValueError(
                 "Latitude {:f} not inside region covered by file, which is from {:f} to {:f}.".format(
                     self.lat, latArray[0], latArray[-1]
@@ -2434,67 +2694,58 @@ class Environment:
 
         # Get ensemble data from file
         try:
-            numMembers = len(weatherData.variables[dictionary["ensemble"]][:])
-        except:
+            members = weatherData.variables[dictionary["ensemble"]][:]
+        except _NETCDF_READ_ERRORS:
             raise ValueError(
                 "Unable to read ensemble data from file. Check file and dictionary."
             )
+        numMembers = len(members)
 
         # Get pressure level data from file
         try:
-            levels = (
-                100 * weatherData.variables[dictionary["level"]][:]
-            )  # Convert mbar to Pa
-        except:
+            levels = weatherData.variables[dictionary["level"]][:]
+        except _NETCDF_READ_ERRORS:
             raise ValueError(
                 "Unable to read pressure levels from file. Check file and dictionary."
             )
+        levels = 100 * levels  # Convert mbar to Pa
 
         ##
         inverseDictionary = {v: k for k, v in dictionary.items()}
         paramDictionary = {
             "time": timeIndex,
-            "ensemble": range(numMembers),
-            "level": range(len(levels)),
-            "latitude": (latIndex - 1, latIndex),
-            "longitude": (lonIndex - 1, lonIndex),
+            "ensemble": slice(None),
+            "level": slice(None),
+            "latitude": slice(latIndex - 1, latIndex + 1),
+            "longitude": slice(lonIndex - 1, lonIndex + 1),
         }
         ##
 
         # Get geopotential data from file
         try:
-            dimensions = weatherData.variables[
-                dictionary["geopotential_height"]
-            ].dimensions[:]
+            if dictionary.get("geopotential_height") in weatherData.variables:
+                variable = weatherData.variables[dictionary["geopotential_height"]]
+                scale = 1
+            else:
+                variable = weatherData.variables[dictionary["geopotential"]]
+                scale = self.g
             params = tuple(
-                [paramDictionary[inverseDictionary[dim]] for dim in dimensions]
+                [paramDictionary[inverseDictionary[dim]] for dim in variable.dimensions]
             )
-            geopotentials = weatherData.variables[dictionary["geopotential_height"]][
-                params
-            ]
-        except:
-            try:
-                dimensions = weatherData.variables[
-                    dictionary["geopotential"]
-                ].dimensions[:]
-                params = tuple(
-                    [paramDictionary[inverseDictionary[dim]] for dim in dimensions]
-                )
-                geopotentials = (
-                    weatherData.variables[dictionary["geopotential"]][params] / self.g
-                )
-            except:
-                raise ValueError(
-                    "Unable to read geopontential height"
-                    " nor geopotential from file. At least"
-                    " one of them is necessary. Check "
-                    " file and dictionary."
-                )
+            geopotentials = variable[params]
+        except _NETCDF_READ_ERRORS:
+            raise ValueError(
+                "Unable to read geopontential height"
+                " nor geopotential from file. At least"
+                " one of them is necessary. Check "
+                " file and dictionary."
+            )
+        geopotentials = geopotentials / scale
 
         # Get temperature from file
         try:
             temperatures = weatherData.variables[dictionary["temperature"]][params]
-        except:
+        except _NETCDF_READ_ERRORS:
             raise ValueError(
                 "Unable to read temperature from file. Check file and dictionary."
             )
@@ -2502,13 +2753,13 @@ class Environment:
         # Get wind data from file
         try:
             windUs = weatherData.variables[dictionary["u_wind"]][params]
-        except:
+        except _NETCDF_READ_ERRORS:
             raise ValueError(
                 "Unable to read wind-u component. Check file and dictionary."
             )
         try:
             windVs = weatherData.variables[dictionary["v_wind"]][params]
-        except:
+        except _NETCDF_READ_ERRORS:
             raise ValueError(
                 "Unable to read wind-v component. Check file and dictionary."
             )
@@ -2517,51 +2768,25 @@ class Environment:
         x, y = self.lat, lon
         x1, y1 = latArray[latIndex - 1], lonArray[lonIndex - 1]
         x2, y2 = latArray[latIndex], lonArray[lonIndex]
+        weights = _bilinear_weights(x, x1, x2, y, y1, y2)
 
         # Determine geopotential in lat, lon
-        f_x1_y1 = geopotentials[:, :, 0, 0]
-        f_x1_y2 = geopotentials[:, :, 0, 1]
-        f_x2_y1 = geopotentials[:, :, 1, 0]
-        f_x2_y2 = geopotentials[:, :, 1, 1]
-        f_x_y1 = ((x2 - x) / (x2 - x1)) * f_x1_y1 + ((x - x1) / (x2 - x1)) * f_x2_y1
-        f_x_y2 = ((x2 - x) / (x2 - x1)) * f_x1_y2 + ((x - x1) / (x2 - x1)) * f_x2_y2
-        height = ((y2 - y) / (y2 - y1)) * f_x_y1 + ((y - y1) / (y2 - y1)) * f_x_y2
+        height = _bilinear_interpolation(geopotentials, weights)
 
         # Determine temperature in lat, lon
-        f_x1_y1 = temperatures[:, :, 0, 0]
-        f_x1_y2 = temperatures[:, :, 0, 1]
-        f_x2_y1 = temperatures[:, :, 1, 0]
-        f_x2_y2 = temperatures[:, :, 1, 1]
-        f_x_y1 = ((x2 - x) / (x2 - x1)) * f_x1_y1 + ((x - x1) / (x2 - x1)) * f_x2_y1
-        f_x_y2 = ((x2 - x) / (x2 - x1)) * f_x1_y2 + ((x - x1) / (x2 - x1)) * f_x2_y2
-        temperature = ((y2 - y) / (y2 - y1)) * f_x_y1 + ((y - y1) / (y2 - y1)) * f_x_y2
+        temperature = _bilinear_interpolation(temperatures, weights)
 
         # Determine wind u in lat, lon
-        f_x1_y1 = windUs[:, :, 0, 0]
-        f_x1_y2 = windUs[:, :, 0, 1]
-        f_x2_y1 = windUs[:, :, 1, 0]
-        f_x2_y2 = windUs[:, :, 1, 1]
-        f_x_y1 = ((x2 - x) / (x2 - x1)) * f_x1_y1 + ((x - x1) / (x2 - x1)) * f_x2_y1
-        f_x_y2 = ((x2 - x) / (x2 - x1)) * f_x1_y2 + ((x - x1) / (x2 - x1)) * f_x2_y2
-        windU = ((y2 - y) / (y2 - y1)) * f_x_y1 + ((y - y1) / (y2 - y1)) * f_x_y2
+        windU = _bilinear_interpolation(windUs, weights)
 
         # Determine wind v in lat, lon
-        f_x1_y1 = windVs[:, :, 0, 0]
-        f_x1_y2 = windVs[:, :, 0, 1]
-        f_x2_y1 = windVs[:, :, 1, 0]
-        f_x2_y2 = windVs[:, :, 1, 1]
-        f_x_y1 = ((x2 - x) / (x2 - x1)) * f_x1_y1 + ((x - x1) / (x2 - x1)) * f_x2_y1
-        f_x_y2 = ((x2 - x) / (x2 - x1)) * f_x1_y2 + ((x - x1) / (x2 - x1)) * f_x2_y2
-        windV = ((y2 - y) / (y2 - y1)) * f_x_y1 + ((y - y1) / (y2 - y1)) * f_x_y2
-
-        # Determine wind speed, heading and direction
-        windSpeed = np.sqrt(windU**2 + windV**2)
-        windHeading = np.arctan2(windU, windV) * (180 / np.pi) % 360
-        windDirection = (windHeading - 180) % 360
+        windV = _bilinear_interpolation(windVs, weights)
 
         # Convert geopotential height to geometric height
         R = self.earthRadius
-        height = R * height / (R - height)
+        denominator = R - height
+        height *= R
+        height /= denominator
 
         # Save ensemble data
         self.levelEnsemble = levels
@@ -2569,9 +2794,6 @@ class Environment:
         self.temperatureEnsemble = temperature
         self.windUEnsemble = windU
         self.windVEnsemble = windV
-        self.windHeadingEnsemble = windHeading
-        self.windDirectionEnsemble = windDirection
-        self.windSpeedEnsemble = windSpeed
         self.numEnsembleMembers = numMembers
 
         # Activate default ensemble
@@ -2582,37 +2804,22 @@ class Environment:
             try:
                 elevations = weatherData.variables[
                     dictionary["surface_geopotential_height"]
-                ][timeIndex, (latIndex - 1, latIndex), (lonIndex - 1, lonIndex)]
-                f_x1_y1 = elevations[0, 0]
-                f_x1_y2 = elevations[0, 1]
-                f_x2_y1 = elevations[1, 0]
-                f_x2_y2 = elevations[1, 1]
-                f_x_y1 = ((x2 - x) / (x2 - x1)) * f_x1_y1 + (
-                    (x - x1) / (x2 - x1)
-                ) * f_x2_y1
-                f_x_y2 = ((x2 - x) / (x2 - x1)) * f_x1_y2 + (
-                    (x - x1) / (x2 - x1)
-                ) * f_x2_y2
-                self.elevation = ((y2 - y) / (y2 - y1)) * f_x_y1 + (
-                    (y - y1) / (y2 - y1)
-                ) * f_x_y2
-            except:
+                ][timeIndex, latIndex - 1 : latIndex + 1, lonIndex - 1 : lonIndex + 1]
+            except _NETCDF_READ_ERRORS:
                 raise ValueError(
                     "Unable to read surface elevation data. Check file and dictionary."
                 )
+            self.elevation = _bilinear_interpolation(elevations, weights)
 
-        # Compute info data
-        self.atmosphericModelInitDate = netCDF4.num2date(
-            timeArray[0], timeArray.units, calendar="gregorian"
-        )
-        self.atmosphericModelEndDate = netCDF4.num2date(
-            timeArray[-1], timeArray.units, calendar="gregorian"
-        )
-        self.atmosphericModelInterval = netCDF4.num2date(
-            (timeArray[-1] - timeArray[0]) / (len(timeArray) - 1),
+        # Compute info data, converting all times in a single call
+        initDate, endDate, interval = netCDF4.num2date(
+            np.array([times[0], times[-1], (times[-1] - times[0]) / (len(times) - 1)]),
             timeArray.units,
             calendar="gregorian",
-        ).hour
+        )
+        self.atmosphericModelInitDate = initDate
+        self.atmosphericModelEndDate = endDate
+        self.atmosphericModelInterval = interval.hour
         self.atmosphericModelInitLat = latArray[0]
         self.atmosphericModelEndLat = latArray[-1]
         self.atmosphericModelInitLon = lonArray[0]
@@ -2628,7 +2835,7 @@ class Environment:
         self.windVs = windVs
         self.levels = levels
         self.temperatures = temperatures
-        self.timeArray = timeArray
+        self.timeArray = times
         self.height = height
 
         # Close weather data
@@ -2664,13 +2871,26 @@ class Environment:
         temperature = self.temperatureEnsemble[member, :]
         windU = self.windUEnsemble[member, :]
         windV = self.windVEnsemble[member, :]
-        windHeading = self.windHeadingEnsemble[member, :]
-        windDirection = self.windDirectionEnsemble[member, :]
-        windSpeed = self.windSpeedEnsemble[member, :]
 
-        # Combine all data into big array
-        data_array = np.ma.column_stack(
-            [
+        # Determine wind speed, heading and direction of this member
+        windSpeed = np.hypot(windU, windV)
+        windHeading = np.rad2deg(np.arctan2(windU, windV)) % 360
+        windDirection = (windHeading + 180) % 360
+
+        # Remove pressure levels with masked content
+        profiles = [
+            levels,
+            height,
+            temperature,
+            windU,
+            windV,
+            windHeading,
+            windDirection,
+            windSpeed,
+        ]
+        mask = np.logical_or.reduce([np.ma.getmaskarray(p) for p in profiles])
+        if mask.any():
+            (
                 levels,
                 height,
                 temperature,
@@ -2679,55 +2899,50 @@ class Environment:
                 windHeading,
                 windDirection,
                 windSpeed,
-            ]
-        )
-
-        # Remove lines with masked content
-        if np.any(data_array.mask):
-            data_array = np.ma.compress_rows(data_array)
+            ) = [np.ma.getdata(p)[~mask] for p in profiles]
             warnings.warn(
                 "Some values were missing from this weather dataset, therefore, certain pressure levels were removed."
             )
 
         # Save atmospheric data
         self.pressure = Function(
-            data_array[:, (1, 0)],
+            np.column_stack([height, levels]),
             inputs="Height Above Sea Level (m)",
             outputs="Pressure (Pa)",
             interpolation="linear",
         )
         self.temperature = Function(
-            data_array[:, (1, 2)],
+            np.column_stack([height, temperature]),
             inputs="Height Above Sea Level (m)",
             outputs="Temperature (K)",
             interpolation="linear",
         )
         self.windDirection = Function(
-            data_array[:, (1, 6)],
+            np.column_stack([height, windDirection]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Direction (Deg True)",
             interpolation="linear",
         )
         self.windHeading = Function(
-            data_array[:, (1, 5)],
+            np.column_stack([height, windHeading]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Heading (Deg True)",
             interpolation="linear",
         )
         self.windSpeed = Function(
-            data_array[:, (1, 7)],
+            np.column_stack([height, windSpeed]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Speed (m/s)",
             interpolation="linear",
         )
         self.windVelocityX = Function(
-            data_array[:, (1, 3)],
+            np.column_stack([height, windU]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Velocity X (m/s)",
             interpolation="linear",
         )
         self.windVelocityY = Function(
-            data_array[:, (1, 4)],
+            np.column_stack([height, windV]),
             inputs="Height Above Sea Level (m)",
             outputs="Wind Velocity Y (m/s)",
             interpolation="linear",
@@ -2739,14 +2954,8 @@ class Environment:
         # Save ensemble member
         self.ensembleMember = member
 
-        # Update air density
-        self.calculateDensityProfile()
-
-        # Update speed of sound
-        self.calculateSpeedOfSoundProfile()
-
-        # Update dynamic viscosity
-        self.calculateDynamicViscosity()
+        # Update air density, speed of sound and dynamic viscosity
+        self.__calculateDerivedProfiles()
 
         return None
 
@@ -2763,106 +2972,72 @@ class Environment:
         -------
         None
         """
-        # Define international standard atmosphere layers
-        geopotential_height = [
-            -2e3,
-            0,
-            11e3,
-            20e3,
-            32e3,
-            47e3,
-            51e3,
-            71e3,
-            80e3,
-        ]  # in geopotential m
-        temperature = [
-            301.15,
-            288.15,
-            216.65,
-            216.65,
-            228.65,
-            270.65,
-            270.65,
-            214.65,
-            196.65,
-        ]  # in K
-        beta = [
-            -6.5e-3,
-            -6.5e-3,
-            0,
-            1e-3,
-            2.8e-3,
-            0,
-            -2.8e-3,
-            -2e-3,
-            0,
-        ]  # Temperature gradient in K/m
-        pressure = [
-            1.27774e5,
-            1.01325e5,
-            2.26320e4,
-            5.47487e3,
-            8.680164e2,
-            1.10906e2,
-            6.69384e1,
-            3.95639e0,
-            8.86272e-2,
-        ]  # in Pa
+        temperatureISA, pressureISA = _international_standard_atmosphere(
+            self.g, self.airGasConstant
+        )
+        self.temperatureISA = copy.copy(temperatureISA)
+        self.pressureISA = copy.copy(pressureISA)
 
-        # Convert geopotential height to geometric height
-        ER = self.earthRadius
-        height = [ER * H / (ER - H) for H in geopotential_height]
-        height = geopotential_height
+        return None
 
-        # Save international standard atmosphere temperature profile
-        self.temperatureISA = Function(
-            np.column_stack([height, temperature]),
-            inputs="Height Above Sea Level (m)",
-            outputs="Temperature (K)",
-            interpolation="linear",
-        )
+    def __calculateDerivedProfiles(self):
+        """Computes the density, speed of sound and dynamic viscosity
+        profiles. When temperature, and pressure for the density, are
+        tabulated on the same heights, all three are computed in one pass over
+        the tabulated values. Otherwise, the Function based methods are used.
 
-        # Get gravity and R
-        g = self.g
-        R = self.airGasConstant
+        Parameters
+        ----------
+        None
 
-        # Create function to compute pressure profile
-        def pressure_function(h):
-            # Convert geometric to geopotential height
-            H = ER * h / (ER + h)
-            H = h
-
-            if H < -2000:
-                return pressure[0]
-            elif H > 80000:
-                return pressure[-1]
-
-            # Find layer that contains height h
-            layer = bisect.bisect(geopotential_height, H) - 1
-
-            # Retrieve layer base geopotential height, temp, beta and pressure
-            Hb = geopotential_height[layer]
-            Tb = temperature[layer]
-            Pb = pressure[layer]
-            B = beta[layer]
-
-            # Compute presure
-            if B != 0:
-                P = Pb * (1 + (B / Tb) * (H - Hb)) ** (-g / (B * R))
-            else:
-                T = Tb + B * (H - Hb)
-                P = Pb * np.exp(-(H - Hb) * (g / (R * T)))
+        Returns
+        -------
+        None
+        """
+        P = self.pressure
+        T = self.temperature
+        if not isinstance(T.source, np.ndarray):
+            self.calculateDensityProfile()
+            self.calculateSpeedOfSoundProfile()
+            self.calculateDynamicViscosity()
+            return None
 
-            # Return answer
-            return P
+        # Retrieve tabulated temperature, as a plain array even if the profile
+        # was built from masked weather data, and constants
+        heights, temperature = np.asarray(T.source).T
+        inputs = T.__inputs__
+        interpolation = T.__interpolation__
+        R = self.airGasConstant
 
-        # Save international standard atmosphere pressure profile
-        self.pressureISA = Function(
-            pressure_function,
-            inputs="Height Above Sea Level (m)",
-            outputs="Pressure (Pa)",
+        # Compute density using P/RT if pressure shares the temperature grid
+        if (
+            isinstance(P.source, np.ndarray)
+            and P.__interpolation__ == interpolation
+            and P.__inputs__ == inputs
+            and np.array_equal(P.source[:, 0], heights)
+        ):
+            with np.errstate(divide="ignore"):
+                density = np.nan_to_num(np.asarray(P.source[:, 1]) / (R * temperature))
+            self.density = Function(
+                np.column_stack([heights, density]),
+                inputs[:],
+                "Air Density (kg/m³)",
+                interpolation,
+            )
+        else:
+            self.calculateDensityProfile()
+
+        # Compute speed of sound using sqrt(gamma*R*T)
+        self.speedOfSound = Function(
+            np.column_stack([heights, np.sqrt(1.4 * R * temperature)]),
+            inputs[:],
+            "Speed of Sound (m/s)",
+            interpolation,
         )
 
+        # Compute dynamic viscosity, also from the tabulated temperature
+        self.calculateDynamicViscosity()
+
         return None
 
     def calculateDensityProfile(self):
@@ -2942,13 +3117,25 @@ class Environment:
         B = 1.458e-6  # Kg/m/s/K^0.5
         S = 110.4  # K
 
-        # Compute dynamic viscosity using u = B*T^(1.4)/(T+S) (See ISO2533)
-        u = (B * T ** (1.5)) / (T + S)
+        # Compute dynamic viscosity using u = B*T^(1.5)/(T+S) (See ISO2533)
+        if isinstance(T.source, np.ndarray):
+            # Evaluate directly on the tabulated temperature to avoid building
+            # intermediate Function objects
+            heights, temperature = np.asarray(T.source).T
+            with np.errstate(divide="ignore"):
+                viscosity = np.nan_to_num((B * temperature**1.5) / (temperature + S))
+            u = Function(
+                np.column_stack([heights, viscosity]),
+                T.__inputs__[:],
+                interpolation=T.__interpolation__,
+            )
+        else:
+            u = (B * T ** (1.5)) / (T + S)
 
-        # Set new output for the calculated density
+        # Set new output for the calculated dynamic viscosity
         u.setOutputs("Dynamic Viscosity (Pa s)")
 
-        # Save calculated density
+        # Save calculated dynamic viscosity
         self.dynamicViscosity = u
 
         return None
@@ -2984,15 +3171,16 @@ class Environment:
 
         # Reset wind heading and velocity magnitude
         self.windHeading = Function(
-            lambda h: (180 / np.pi)
-            * np.arctan2(self.windVelocityX(h), self.windVelocityY(h))
+            lambda h: np.rad2deg(
+                np.arctan2(self.windVelocityX(h), self.windVelocityY(h))
+            )
             % 360,
             "Height (m)",
             "Wind Heading (degrees)",
             extrapolation="constant",
         )
         self.windSpeed = Function(
-            lambda h: (self.windVelocityX(h) ** 2 + self.windVelocityY(h) ** 2) ** 0.5,
+            lambda h: np.hypot(self.windVelocityX(h), self.windVelocityY(h)),
             "Height (m)",
             "Wind Speed (m/s)",
             extrapolation="constant",
@@ -3386,52 +3574,37 @@ class Environment:
         plotInfo : Dict
             Dict of data relevant to plot externally
         """
-        grid = np.linspace(self.elevation, self.maxExpectedHeight)
+        # Evaluate each profile on the whole grid with a single call
+        grid = np.linspace(self.elevation, self.maxExpectedHeight).tolist()
         plotInfo = dict(
-            grid=[i for i in grid],
-            windSpeed=[self.windSpeed(i) for i in grid],
-            windDirection=[self.windDirection(i) for i in grid],
-            speedOfSound=[self.speedOfSound(i) for i in grid],
-            density=[self.density(i) for i in grid],
-            windVelX=[self.windVelocityX(i) for i in grid],
-            windVelY=[self.windVelocityY(i) for i in grid],
-            pressure=[self.pressure(i) / 100 for i in grid],
-            temperature=[self.temperature(i) for i in grid],
+            grid=grid,
+            windSpeed=self.windSpeed(grid),
+            windDirection=self.windDirection(grid),
+            speedOfSound=self.speedOfSound(grid),
+            density=self.density(grid),
+            windVelX=self.windVelocityX(grid),
+            windVelY=self.windVelocityY(grid),
+            pressure=[p / 100 for p in self.pressure(grid)],
+            temperature=self.temperature(grid),
         )
         if self.atmosphericModelType != "Ensemble":
             return plotInfo
         currentMember = self.ensembleMember
-        # List for each ensemble
+        # List for each ensemble, selecting each member only once
         plotInfo["ensembleWindVelocityX"] = []
-        for i in range(self.numEnsembleMembers):
-            self.selectEnsembleMember(i)
-            plotInfo["ensembleWindVelocityX"].append(
-                [self.windVelocityX(i) for i in grid]
-            )
         plotInfo["ensembleWindVelocityY"] = []
-        for i in range(self.numEnsembleMembers):
-            self.selectEnsembleMember(i)
-            plotInfo["ensembleWindVelocityY"].append(
-                [self.windVelocityY(i) for i in grid]
-            )
         plotInfo["ensembleWindSpeed"] = []
-        for i in range(self.numEnsembleMembers):
-            self.selectEnsembleMember(i)
-            plotInfo["ensembleWindSpeed"].append([self.windSpeed(i) for i in grid])
         plotInfo["ensembleWindDirection"] = []
-        for i in range(self.numEnsembleMembers):
-            self.selectEnsembleMember(i)
-            plotInfo["ensembleWindDirection"].append(
-                [self.windDirection(i) for i in grid]
-            )
         plotInfo["ensemblePressure"] = []
-        for i in range(self.numEnsembleMembers):
-            self.selectEnsembleMember(i)
-            plotInfo["ensemblePressure"].append([self.pressure(i) for i in grid])
         plotInfo["ensembleTemperature"] = []
         for i in range(self.numEnsembleMembers):
             self.selectEnsembleMember(i)
-            plotInfo["ensembleTemperature"].append([self.temperature(i) for i in grid])
+            plotInfo["ensembleWindVelocityX"].append(self.windVelocityX(grid))
+            plotInfo["ensembleWindVelocityY"].append(self.windVelocityY(grid))
+            plotInfo["ensembleWindSpeed"].append(self.windSpeed(grid))
+            plotInfo["ensembleWindDirection"].append(self.windDirection(grid))
+            plotInfo["ensemblePressure"].append(self.pressure(grid))
+            plotInfo["ensembleTemperature"].append(self.temperature(grid))
 
         # Clean up
         self.selectEnsembleMember(currentMember)
@@ -3582,39 +3755,14 @@ class Environment:
             Returns "W" for western hemisphere and "E" for eastern hemisphere
         """
 
-        # Calculate the central meridian of UTM zone
-        if lon != 0:
-            signal = lon / abs(lon)
-            if signal > 0:
-                aux = lon - 3
-                aux = aux * signal
-                div = aux // 6
-                lon_mc = div * 6 + 3
-                EW = "E"
-            else:
-                aux = lon + 3
-                aux = aux * signal
-                div = aux // 6
-                lon_mc = (div * 6 + 3) * signal
-                EW = "W"
-        else:
-            lon_mc = 3
-            EW = "W|E"
+        # Calculate the UTM zone number, zones are 6° wide starting at -180°,
+        # and its central meridian
+        utmZone = min(int((lon + 180) // 6) + 1, 60)
+        lon_mc = utmZone * 6 - 183
+        EW = "E" if lon > 0 else "W" if lon < 0 else "W|E"
 
         # Select the desired datum (i.e. the ellipsoid parameters)
-        if datum == "SAD69":
-            semiMajorAxis = 6378160.0
-            flattening = 1 / 298.25
-        elif datum == "WGS84":
-            semiMajorAxis = 6378137.0
-            flattening = 1 / 298.257223563
-        elif datum == "NAD83":
-            semiMajorAxis = 6378137.0
-            flattening = 1 / 298.257024899
-        else:
-            # SIRGAS2000
-            semiMajorAxis = 6378137.0
-            flattening = 1 / 298.257223563
+        semiMajorAxis, flattening = _ELLIPSOIDS.get(datum, _ELLIPSOIDS["SIRGAS2000"])
 
         # Evaluate the hemisphere and determine the N coordinate at the Equator
         if lat < 0:
@@ -3624,10 +3772,11 @@ class Environment:
             N0 = 0
             hemis = "N"
 
-        # Convert the input lat and lon to radians
-        lat = lat * np.pi / 180
-        lon = lon * np.pi / 180
-        lon_mc = lon_mc * np.pi / 180
+        # Convert the input lat and its distance to the central meridian to
+        # radians
+        latRad = math.radians(lat)
+        dLonRad = math.radians(lon - lon_mc)
+        sinLat, cosLat, tanLat = math.sin(latRad), math.cos(latRad), math.tan(latRad)
 
         # Evaluate reference parameters
         K0 = 1 - 1 / 2500
@@ -3637,19 +3786,19 @@ class Environment:
         # Evaluate auxiliary parameters
         A = e2 * e2
         B = A * e2
-        C = np.sin(2 * lat)
-        D = np.sin(4 * lat)
-        E = np.sin(6 * lat)
-        F = (1 - e2 / 4 - 3 * A / 64 - 5 * B / 256) * lat
+        C = math.sin(2 * latRad)
+        D = math.sin(4 * latRad)
+        E = math.sin(6 * latRad)
+        F = (1 - e2 / 4 - 3 * A / 64 - 5 * B / 256) * latRad
         G = (3 * e2 / 8 + 3 * A / 32 + 45 * B / 1024) * C
         H = (15 * A / 256 + 45 * B / 1024) * D
         I = (35 * B / 3072) * E
 
         # Evaluate other reference parameters
-        n = semiMajorAxis / ((1 - e2 * (np.sin(lat) ** 2)) ** 0.5)
-        t = np.tan(lat) ** 2
-        c = e2lin * (np.cos(lat) ** 2)
-        ag = (lon - lon_mc) * np.cos(lat)
+        n = semiMajorAxis / ((1 - e2 * (sinLat**2)) ** 0.5)
+        t = tanLat**2
+        c = e2lin * (cosLat**2)
+        ag = dLonRad * cosLat
         m = semiMajorAxis * (F - G + H - I)
 
         # Evaluate new auxiliary parameters
@@ -3660,15 +3809,7 @@ class Environment:
 
         # Evaluate the final coordinates
         x = 500000 + K0 * n * (ag + J + K)
-        y = N0 + K0 * (m + n * np.tan(lat) * (ag * ag / 2 + L + M))
-
-        # Convert the output lat and lon to degrees
-        lat = lat * 180 / np.pi
-        lon = lon * 180 / np.pi
-        lon_mc = lon_mc * 180 / np.pi
-
-        # Calculate the UTM zone number
-        utmZone = int((lon_mc + 183) / 6)
+        y = N0 + K0 * (m + n * tanLat * (ag * ag / 2 + L + M))
 
         # Calculate the UTM zone letter
         letters = "CDEFGHJKLMNPQRSTUVWXX"
@@ -3713,19 +3854,7 @@ class Environment:
         centralMeridian = utmZone * 6 - 183  # degrees
 
         # Select the desired datum
-        if datum == "SAD69":
-            semiMajorAxis = 6378160.0
-            flattening = 1 / 298.25
-        elif datum == "WGS84":
-            semiMajorAxis = 6378137.0
-            flattening = 1 / 298.257223563
-        elif datum == "NAD83":
-            semiMajorAxis = 6378137.0
-            flattening = 1 / 298.257024899
-        else:
-            # SIRGAS2000
-            semiMajorAxis = 6378137.0
-            flattening = 1 / 298.257223563
+        semiMajorAxis, flattening = _ELLIPSOIDS.get(datum, _ELLIPSOIDS["SIRGAS2000"])
 
         # Calculate reference values
         K0 = 1 - 1 / 2500
@@ -3772,11 +3901,11 @@ class Environment:
 
         # Finally calculate the coordinates in lat/lot
         lat = lat1 - (n1 * np.tan(lat1) / r1) * (d * d / 2 - I + J)
-        lon = centralMeridian * np.pi / 180 + (K + L) / np.cos(lat1)
+        lon = np.deg2rad(centralMeridian) + (K + L) / np.cos(lat1)
 
         # Convert final lat/lon to Degrees
-        lat = lat * 180 / np.pi
-        lon = lon * 180 / np.pi
+        lat = np.rad2deg(lat)
+        lon = np.rad2deg(lon)
 
         return lat, lon
 
@@ -3791,8 +3920,9 @@ class Environment:
 
         Parameters
         ----------
-        lat : float
-            latitude in which the Earth radius will be calculated
+        lat : float, array
+            latitude in which the Earth radius will be calculated. An array of
+            latitudes is evaluated at once.
         datum : string
             The desired reference ellipsoide model, the following options are
             available: "SAD69", "WGS84", "NAD83", and "SIRGAS2000". The default
@@ -3801,43 +3931,26 @@ class Environment:
 
         Returns
         -------
-        float:
+        float, array:
             Earth Radius at the desired latitude in meters
         """
         # Select the desired datum (i.e. the ellipsoid parameters)
-        if datum == "SAD69":
-            semiMajorAxis = 6378160.0
-            flattening = 1 / 298.25
-        elif datum == "WGS84":
-            semiMajorAxis = 6378137.0
-            flattening = 1 / 298.257223563
-        elif datum == "NAD83":
-            semiMajorAxis = 6378137.0
-            flattening = 1 / 298.257024899
-        else:
-            # SIRGAS2000
-            semiMajorAxis = 6378137.0
-            flattening = 1 / 298.257223563
+        semiMajorAxis, flattening = _ELLIPSOIDS.get(datum, _ELLIPSOIDS["SIRGAS2000"])
 
         # Calculate the semi minor axis length
         # semiMinorAxis = semiMajorAxis - semiMajorAxis*(flattening**(-1))
         semiMinorAxis = semiMajorAxis * (1 - flattening)
 
-        # Convert latitude to radians
-        lat = lat * np.pi / 180
+        # Convert latitude to radians and evaluate its sine and cosine once
+        lat = np.deg2rad(lat)
+        cosLat, sinLat = np.cos(lat), np.sin(lat)
 
         # Calculate the Earth Radius in meters
         eRadius = np.sqrt(
-            (
-                (np.cos(lat) * (semiMajorAxis**2)) ** 2
-                + (np.sin(lat) * (semiMinorAxis**2)) ** 2
-            )
-            / ((np.cos(lat) * semiMajorAxis) ** 2 + (np.sin(lat) * semiMinorAxis) ** 2)
+            ((cosLat * semiMajorAxis**2) ** 2 + (sinLat * semiMinorAxis**2) ** 2)
+            / ((cosLat * semiMajorAxis) ** 2 + (sinLat * semiMinorAxis) ** 2)
         )
 
-        # Convert latitude to degress
-        lat = lat * 180 / np.pi
-
         return eRadius
 
     def decimalDegressToArcSeconds(self, angle):
@@ -3860,17 +3973,10 @@ class Environment:
             The arc Seconds. 1 arc-second = (1/3600)*degree
         """
 
-        if angle < 0:
-            signal = -1
-        else:
-            signal = 1
-
-        deg = (signal * angle) // 1
-        min = abs(signal * angle - deg) * 60 // 1
-        sec = abs((signal * angle - deg) * 60 - min) * 60
-        # print("The angle {:f} is equals to {:.0f}º {:.0f}' {:.3f}'' ".format(
-        #    angle, signal*deg, min, sec
-        # ))
+        # Split the absolute angle into its integer and fractional parts
+        fraction, deg = math.modf(abs(angle))
+        fraction, min = math.modf(fraction * 60)
+        sec = fraction * 60
 
         return deg, min, sec
 
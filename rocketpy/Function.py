@@ -309,12 +309,21 @@ class Function:
             self.getValueOpt = getValueOpt
 
         elif self.__interpolation__ == "linear":
+            # Interval of the last evaluation, consecutive calls (such as
+            # integration steps) usually fall in the same one
+            lastInterval = [1 if len(xData) > 1 else 0]
 
             def getValueOpt(x):
-                xInterval = np.searchsorted(xData, x)
+                xInterval = lastInterval[0]
+                if not xData[xInterval - 1] < x <= xData[xInterval]:
+                    xInterval = np.searchsorted(xData, x)
+                    if 0 < xInterval < len(xData):
+                        lastInterval[0] = xInterval
                 # Interval found... interpolate... or extrapolate
                 if xmin <= x <= xmax:
-                    # Interpolate
+                    # Interpolate, the first point has no interval to its left
+                    if xInterval == 0:
+                        return yData[0]
                     dx = float(xData[xInterval] - xData[xInterval - 1])
                     dy = float(yData[xInterval] - yData[xInterval - 1])
                     y = (x - xData[xInterval - 1]) * (dy / dx) + yData[xInterval - 1]
@@ -1,6 +1,7 @@
 import datetime
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 import pytz
 from rocketpy import Environment, Flight, Rocket, SolidMotor
@@ -48,16 +49,62 @@ def test_env_set_date_time_zone(example_env):
     assert example_env.date == dateAwareUTC
 
 
+def test_env_set_date_numpy_datetime64(example_env):
+    example_env.setDate(np.datetime64("2022-05-06T12:30"))
+    assert example_env.date == datetime.datetime(2022, 5, 6, 12, 30, tzinfo=pytz.utc)
+
+
 def test_env_set_location(example_env):
     example_env.setLocation(-21.960641, -47.482122)
     assert example_env.lat == -21.960641 and example_env.lon == -47.482122
 
 
+def test_env_set_location_updates_earth_radius(example_env):
+    equatorialRadius = example_env.earthRadius
+    example_env.setLocation(90, 0)
+    assert equatorialRadius == pytest.approx(6378137.0)
+    assert example_env.earthRadius == pytest.approx(6356752.314245)
+
+
+@pytest.mark.parametrize(
+    "longitude, zone, centralMeridian",
+    [(-106.97, 13, -105), (-2, 30, -3), (2, 31, 3), (8.07, 32, 9), (180, 60, 177)],
+)
+def test_geodesic_to_utm_zone(example_env, longitude, zone, centralMeridian):
+    x, y, utmZone, _, hemis, _ = example_env.geodesicToUtm(32.99, longitude, "WGS84")
+    assert utmZone == zone
+    lat, lon = example_env.utmToGeodesic(x, y, utmZone, hemis, "WGS84")
+    assert lon == pytest.approx(longitude)
+    # Eastings grow away from the central meridian, at 500 km
+    assert (x - 500000) * (longitude - centralMeridian) >= 0
+
+
 def test_set_elevation(example_env):
     example_env.setElevation(elevation=200)
     assert example_env.elevation == 200
 
 
+def test_open_elevation_is_fetched_once(example_env, capsys):
+    import importlib
+    from unittest.mock import MagicMock
+
+    EnvironmentModule = importlib.import_module("rocketpy.Environment")
+    EnvironmentModule._fetch_open_elevation.cache_clear()
+    response = MagicMock(content=b'{"results": [{"elevation": 1401}]}')
+    example_env.setLocation(32.990254, -106.974998)
+    with patch.object(
+        EnvironmentModule._SESSION, "get", return_value=response
+    ) as sessionGet:
+        example_env.setElevation()
+        example_env.setElevation()
+    assert sessionGet.call_count == 1
+    assert example_env.elevation == 1401
+    # Cached lookups still report the elevation to the user
+    out = capsys.readouterr().out
+    assert out.count("Fetching elevation from open-elevation.com...") == 2
+    assert out.count("Elevation received: 1401") == 2
+
+
 def test_set_topographic_profile(example_env):
     example_env.setLocation(46.90479, 8.07575)
     example_env.setTopographicProfile(
@@ -65,10 +112,30 @@ def test_set_topographic_profile(example_env):
         file="data/sites/switzerland/NASADEM_NC_n46e008.nc",
         dictionary="netCDF4",
     )
-    assert (
-        example_env.getElevationFromTopographicProfile(example_env.lat, example_env.lon)
-        == 1565
+    assert example_env.getElevationFromTopographicProfile(
+        example_env.lat, example_env.lon
+    ) == pytest.approx(1565, abs=1)
+
+
+def test_get_elevation_batch(example_env):
+    example_env.setTopographicProfile(
+        type="NASADEM_HGT",
+        file="data/sites/switzerland/NASADEM_NC_n46e008.nc",
+        dictionary="netCDF4",
     )
+    lats = [46.90479, example_env.elevLatArray[10], 46.5]
+    lons = [8.07575, example_env.elevLonArray[20], 8.5]
+    elevations = example_env.getElevationBatch(lats, lons)
+    assert elevations[1] == example_env.elevArray[10, 20]
+    for lat, lon, elevation in zip(lats, lons, elevations):
+        assert example_env.getElevationFromTopographicProfile(
+            lat, lon
+        ) == pytest.approx(elevation)
+
+    # Points outside the file region are flagged without aborting the batch
+    elevations = example_env.getElevationBatch([46.5, 45.0, 46.5], [8.5, 8.5, 10.0])
+    assert not np.isnan(elevations[0])
+    assert np.isnan(elevations[1]) and np.isnan(elevations[2])
 
 
 @patch("matplotlib.pyplot.show")
@@ -78,6 +145,26 @@ def test_standard_atmosphere(mock_show, example_env):
     assert example_env.pressure(0) == 101325.0
 
 
+def test_standard_atmosphere_is_built_on_first_access(example_env):
+    assert "pressure" not in example_env.__dict__
+    # Failing properties and unknown names do not build the standard atmosphere
+    with pytest.raises(AttributeError):
+        example_env.windSpeedEnsemble
+    with pytest.raises(AttributeError):
+        example_env.notAnAttribute
+    assert "pressure" not in example_env.__dict__
+    assert example_env.temperature(0) == pytest.approx(288.15)
+    assert example_env.density(0) == pytest.approx(1.225, abs=1e-3)
+
+
+def test_standard_atmosphere_does_not_replace_processed_profiles(example_env):
+    example_env.processCustomAtmosphere(temperature=300, wind_u=5, wind_v=0)
+    assert example_env.temperature(100) == 300
+    with pytest.raises(AttributeError):
+        example_env.density
+    assert example_env.temperature(100) == 300
+
+
 @patch("matplotlib.pyplot.show")
 def test_custom_atmosphere(mock_show, example_env):
     example_env.setAtmosphericModel(
@@ -93,6 +180,85 @@ def test_custom_atmosphere(mock_show, example_env):
     assert example_env.temperature(100) == 300
 
 
+def test_custom_atmosphere_wind_profiles_between_heights(example_env):
+    example_env.setAtmosphericModel(
+        type="CustomAtmosphere",
+        wind_u=[(0, 5), (1000, 10), (3000, -3)],
+        wind_v=[(0, -2), (2000, 4)],
+    )
+    # At 2500 m, between heights where U changes sign, the wind still blows
+    # almost north
+    windU, windV = 0.25, 4
+    assert example_env.windVelocityX(2500) == pytest.approx(windU)
+    assert example_env.windSpeed(2500) == pytest.approx(np.hypot(windU, windV))
+    assert example_env.windHeading(2500) == pytest.approx(
+        np.degrees(np.arctan2(windU, windV))
+    )
+    assert example_env.windDirection(2500) == pytest.approx(
+        np.degrees(np.arctan2(windU, windV)) + 180
+    )
+    heights = np.array([0, 500, 2500])
+    assert example_env.windSpeed.getValue(heights) == pytest.approx(
+        [np.hypot(5, -2), np.hypot(7.5, -0.5), np.hypot(windU, windV)]
+    )
+
+
+def test_wind_gust_profiles_between_heights(example_env):
+    example_env.setAtmosphericModel(
+        type="CustomAtmosphere",
+        wind_u=[(0, -2), (1000, 2)],
+        wind_v=[(0, 3), (1000, 3)],
+    )
+    example_env.addWindGust(1, 1)
+    # U changes sign between the wind heights, so the wind crosses north
+    assert example_env.windVelocityX(250) == pytest.approx(0)
+    assert example_env.windHeading(250) == pytest.approx(0)
+    assert example_env.windSpeed(250) == pytest.approx(4)
+    assert example_env.windHeading(125) == pytest.approx(
+        np.degrees(np.arctan2(-0.5, 4)) % 360
+    )
+    assert example_env.windSpeed(600) == pytest.approx(np.hypot(1.4, 4))
+    # Gusts varying with height
+    example_env.addWindGust(lambda h: h / 1000, 0)
+    assert example_env.windSpeed(500) == pytest.approx(np.hypot(1.5, 4))
+
+
+def test_dynamic_viscosity_profile(example_env):
+    example_env.setAtmosphericModel(
+        type="CustomAtmosphere", temperature=[(0, 300), (1000, 280)]
+    )
+    assert isinstance(example_env.dynamicViscosity.source, np.ndarray)
+    assert example_env.dynamicViscosity(1000) == pytest.approx(
+        1.458e-6 * 280**1.5 / (280 + 110.4)
+    )
+    # Callable temperature profiles are still supported
+    example_env.setAtmosphericModel(type="CustomAtmosphere", temperature=290)
+    assert example_env.dynamicViscosity(1000) == pytest.approx(
+        1.458e-6 * 290**1.5 / (290 + 110.4)
+    )
+
+
+def test_forecast_retries_step_back_one_cycle(example_env):
+    # Record each attempted forecast url, making every attempt fail
+    attemptedFiles = []
+
+    def failingProcess(file, dictionary):
+        attemptedFiles.append(file)
+        raise OSError
+
+    with patch.object(example_env, "processForecastReanalysis", failingProcess):
+        with pytest.raises(RuntimeError):
+            example_env.setAtmosphericModel(type="Forecast", file="GFS")
+
+    cycles = [
+        datetime.datetime.strptime(file[-24:], "gfs%Y%m%d/gfs_0p25_%Hz")
+        for file in attemptedFiles
+    ]
+    assert len(cycles) == 10
+    for newer, older in zip(cycles[:-1], cycles[1:]):
+        assert newer - older == datetime.timedelta(hours=6)
+
+
 @patch("matplotlib.pyplot.show")
 def test_wyoming_sounding_atmosphere(mock_show, example_env):
     URL = "http://weather.uwyo.edu/cgi-bin/sounding?region=samer&TYPE=TEXT%3ALIST&YEAR=2019&MONTH=02&FROM=0500&TO=0512&STNM=83779"
@@ -155,6 +321,127 @@ def test_era5_atmosphere(mock_show):
     assert Env.allInfo() == None
 
 
+def test_remote_reanalysis_is_cached():
+    import netCDF4
+
+    openDataset = netCDF4.Dataset
+    openedFiles = []
+
+    def localDataset(file, *args, **kwargs):
+        openedFiles.append(file)
+        return openDataset(file.replace("https://example.com/", "data/weather/"))
+
+    environments = [
+        Environment(
+            railLength=5,
+            latitude=32.990254,
+            longitude=-106.974998,
+            elevation=1400,
+            date=(2018, 10, 15, 12),
+            datum="WGS84",
+        )
+        for _ in range(2)
+    ]
+    with patch("netCDF4.Dataset", localDataset):
+        for Env in environments:
+            Env.setAtmosphericModel(
+                type="Reanalysis",
+                file="https://example.com/SpaceportAmerica_2018_ERA-5.nc",
+                dictionary="ECMWF",
+            )
+        # Keyword arguments hit the same cache entry
+        environments[1].processForecastReanalysis(
+            file="https://example.com/SpaceportAmerica_2018_ERA-5.nc",
+            dictionary=environments[1].atmosphericModelDict,
+        )
+    assert len(openedFiles) == 1
+    assert environments[0].pressure is not environments[1].pressure
+    assert environments[0].latArray is not environments[1].latArray
+    assert environments[0].windUs is not environments[1].windUs
+    assert environments[1].temperature(5000) == environments[0].temperature(5000)
+    # Forecast and ensemble entries are kept apart
+    assert Environment.processForecastReanalysis.__name__ == (
+        "processForecastReanalysis"
+    )
+    assert Environment.processEnsemble.__name__ == "processEnsemble"
+
+
+def test_local_reanalysis_is_cached_until_modified(tmp_path):
+    import os
+    import shutil
+
+    import netCDF4
+
+    file = str(tmp_path / "era5.nc")
+    shutil.copy("data/weather/SpaceportAmerica_2018_ERA-5.nc", file)
+    openDataset = netCDF4.Dataset
+    openedFiles = []
+
+    def countedDataset(file, *args, **kwargs):
+        openedFiles.append(file)
+        return openDataset(file, *args, **kwargs)
+
+    Env = Environment(
+        railLength=5,
+        latitude=32.990254,
+        longitude=-106.974998,
+        date=(2018, 10, 15, 12),
+        datum="WGS84",
+    )
+    with patch("netCDF4.Dataset", countedDataset):
+        Env.setAtmosphericModel(type="Reanalysis", file=file, dictionary="ECMWF")
+        Env.setAtmosphericModel(type="Reanalysis", file=file, dictionary="ECMWF")
+        assert len(openedFiles) == 1
+        # Touching the file invalidates the cached data
+        stat = os.stat(file)
+        os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        Env.setAtmosphericModel(type="Reanalysis", file=file, dictionary="ECMWF")
+        assert len(openedFiles) == 2
+
+
+def test_cached_ensemble_restores_derived_profiles(tmp_path):
+    import shutil
+
+    # Two copies of the same file are cached as two ensembles
+    files = [str(tmp_path / "ensemble{}.nc".format(i)) for i in range(2)]
+    for file in files:
+        shutil.copy("data/weather/LASC2019_TATUI_reanalysis_ensemble.nc", file)
+    Env = Environment(
+        railLength=5,
+        latitude=-23.363611,
+        longitude=-48.011389,
+        date=(2019, 8, 10, 21),
+        datum="WGS84",
+    )
+    dictionary = {
+        "time": "time",
+        "latitude": "latitude",
+        "longitude": "longitude",
+        "level": "level",
+        "ensemble": "number",
+        "temperature": "t",
+        "surface_geopotential_height": None,
+        "geopotential_height": None,
+        "geopotential": "z",
+        "u_wind": "u",
+        "v_wind": "v",
+    }
+    Env.processEnsemble(files[0], dictionary)
+    Env.processEnsemble(files[1], dictionary)
+    Env.selectEnsembleMember(5)
+    # Reloading the first ensemble restores member 0 and its derived profiles
+    Env.processEnsemble(files[0], dictionary)
+    assert Env.ensembleMember == 0
+    heights, pressures = Env.pressure.source.T
+    temperatures = Env.temperature.getValue(heights)
+    assert Env.density.getValue(heights) == pytest.approx(
+        pressures / (Env.airGasConstant * np.array(temperatures))
+    )
+    assert Env.speedOfSound.getValue(heights) == pytest.approx(
+        np.sqrt(1.4 * Env.airGasConstant * np.array(temperatures))
+    )
+
+
 @pytest.mark.slow
 @patch("matplotlib.pyplot.show")
 def test_gefs_atmosphere(mock_show, example_env_robust):
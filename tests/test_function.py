@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from rocketpy import Function
+
+
+@pytest.fixture
+def linear_func():
+    return Function(
+        np.array([[0, 1], [1, 3], [2.5, -1], [4, 0], [5, 2]]),
+        interpolation="linear",
+        extrapolation="constant",
+    )
+
+
+def test_linear_get_value_opt_at_knots(linear_func):
+    xData, yData = linear_func.source.T
+    for x, y in zip(xData, yData):
+        assert linear_func.getValueOpt(x) == pytest.approx(y)
+    # Same knots, visited backwards
+    for x, y in zip(xData[::-1], yData[::-1]):
+        assert linear_func.getValueOpt(x) == pytest.approx(y)
+
+
+def test_linear_get_value_opt_forward_and_backward(linear_func):
+    xData, yData = linear_func.source.T
+    forward = np.linspace(0, 5, 41)
+    backward = [4.9, 4.2, 3.1, 2.6, 2.4, 1.1, 0.9, 0.3, 0.05]
+    jumps = [0.2, 4.7, 1.5, 3.9, 0.0, 5.0, 2.5]
+    for x in np.concatenate([forward, backward, jumps]):
+        assert linear_func.getValueOpt(x) == pytest.approx(np.interp(x, xData, yData))
+
+
+def test_linear_get_value_opt_extrapolation(linear_func):
+    xData, yData = linear_func.source.T
+    # Queries outside the domain must not leave a wrong interval behind
+    for x in [-1, 0.5, 7, 0.5, -3, 4.5, 10, 4.5, -0.1, 0]:
+        assert linear_func.getValueOpt(x) == pytest.approx(np.interp(x, xData, yData))
+
+
+def test_linear_get_value_opt_single_point():
+    func = Function(
+        np.array([[2.0, 5.0]]), interpolation="linear", extrapolation="constant"
+    )
+    for x in [1, 2, 3, 2]:
+        assert func.getValueOpt(x) == pytest.approx(np.interp(x, [2.0], [5.0]))